@@ -1,9 +1,28 @@
 from .object import Object
 from .py import Py
+from .regex_cache import RegexCache
+from .conversion_cache import ConversionCache
 from .string import String
+from .string_view import StringView
+from .string_decoder import StringDecoder
+from .string_encoder import StringEncoder
+from .multi_replacer import MultiReplacer
+from .translator import Translator
+from .normalizer import Normalizer
+from .string_array import StringArray
+from .parallel_normalizer import ParallelNormalizer
+from .file_normalizer import FileNormalizer
+from .file_searcher import FileSearcher
+from .number_parser import NumberParser
+from .check_digit import CheckDigit
+from .name_index import NameIndex
+from .frozen_string import FrozenString
 from .datetime.datetime import Datetime
 from .datetime.weekday import WeekDay
 from .dictionary import Dictionary
+from .record_schema import RecordSchema
+from .dictionary_table import DictionaryTable
+from .dictionary_table_row import DictionaryTableRow
 from .timeout_error import TimeoutError
 from .web.web_browser import WebBrowser
 from .web.element import Element
@@ -12,10 +31,29 @@ from .web.element import Element
 __all__ = [
     Object,
     Py,
+    RegexCache,
+    ConversionCache,
     String,
+    StringView,
+    StringDecoder,
+    StringEncoder,
+    MultiReplacer,
+    Translator,
+    Normalizer,
+    StringArray,
+    ParallelNormalizer,
+    FileNormalizer,
+    FileSearcher,
+    NumberParser,
+    CheckDigit,
+    NameIndex,
+    FrozenString,
     Datetime,
     WeekDay,
     Dictionary,
+    RecordSchema,
+    DictionaryTable,
+    DictionaryTableRow,
     TimeoutError,
     WebBrowser,
     Element,
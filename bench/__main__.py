@@ -0,0 +1,42 @@
+import argparse
+import json
+import sys
+from scent_python.bench import suite
+
+
+def main(arguments: list = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m scent_python.bench", description="String、Dictionary、Datetimeのベンチマークを実行する。")
+    parser.add_argument("-k", "--filter", help="名前が正規表現に一致するベンチマークだけを実行する。")
+    parser.add_argument("-n", "--samples", type=int, default=20, help="計測の繰り返し回数。")
+    parser.add_argument("-s", "--size", type=int, default=1000, help="1回の計測で処理する値の数。")
+    parser.add_argument("-o", "--output", help="結果のJSONを保存するファイル。省略した場合は標準出力に出力する。")
+    parser.add_argument("-b", "--baseline", help="比較する結果のJSONファイル。")
+    parser.add_argument("-t", "--threshold", type=float, default=0.2, help="遅くなったと判定する比率。0.2の場合は基準より20%%を超えて遅い結果を失敗とする。")
+    parser.add_argument("-m", "--metric", default="p50", choices=("mean", "p50", "p99"), help="比較に使用する統計値。")
+    parser.add_argument("--list", action="store_true", help="ベンチマークの名前と計測されていない公開メソッドを表示する。")
+    options = parser.parse_args(arguments)
+    if options.list:
+        table = suite.benchmarks(1)
+        for name, setup, run in table:
+            print(name)
+        for name in suite.uncovered(table):
+            print("not covered: " + name, file=sys.stderr)
+        return 0
+    result = suite.run(options.filter, options.samples, options.size, sys.stderr)
+    if options.output is None:
+        json.dump(result, sys.stdout, ensure_ascii=False, indent=2)
+        print()
+    else:
+        suite.save(result, options.output)
+    if options.baseline is None:
+        return 0
+    regressions = suite.compare(result, suite.load(options.baseline), options.threshold, options.metric)
+    for name, previous, current, ratio in regressions:
+        print(f"regression: {name} {options.metric} {previous * 1000000:.3f} us -> {current * 1000000:.3f} us (x{ratio:.2f})", file=sys.stderr)
+    if regressions.__len__() > 0:
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,56 @@
+import scent_python as scent
+import time
+
+
+def _put_and_remove(number: int) -> tuple:
+    """number個のキーを配置してから、すべてのキーを配置した順に削除する秒数を計測する。
+    """
+    keys = [str(index) for index in range(number)]
+    dictionary = scent.Dictionary()
+    start = time.perf_counter()
+    for key in keys:
+        dictionary.put(key, key)
+    put = time.perf_counter() - start
+    if dictionary.length() != number or dictionary.keys()[-1] != keys[-1]:
+        raise AssertionError("put did not keep the insertion order.")
+    start = time.perf_counter()
+    for key in keys:
+        dictionary.remove_key(key)
+    remove = time.perf_counter() - start
+    if dictionary.length() != 0:
+        raise AssertionError("remove_key did not remove every key.")
+    return (put, remove)
+
+
+def _add_and_extend(number: int) -> tuple:
+    """number個の値をaddで1件ずつ追加する秒数と、extendで一括して追加する秒数を計測する。
+    """
+    values = [str(index) for index in range(number)]
+    dictionary = scent.Dictionary()
+    start = time.perf_counter()
+    for value in values:
+        dictionary.add(value)
+    add = time.perf_counter() - start
+    if dictionary.length() != number:
+        raise AssertionError("add did not append every value.")
+    dictionary = scent.Dictionary()
+    start = time.perf_counter()
+    dictionary.extend(values)
+    extend = time.perf_counter() - start
+    if dictionary.keys()[-1] != str(number - 1):
+        raise AssertionError("extend did not number the keys in order.")
+    return (add, extend)
+
+
+def main(maximum: int = 1000000):
+    number = maximum // 8
+    while number <= maximum:
+        put, remove = _put_and_remove(number)
+        print(f"{number:9d} keys  put {put:7.3f} s ({put / number * 1000000000:6.1f} ns/key)  remove_key {remove:7.3f} s ({remove / number * 1000000000:6.1f} ns/key)")
+        add, extend = _add_and_extend(number)
+        print(f"{number:9d} values add {add:7.3f} s ({add / number * 1000000000:6.1f} ns/value)  extend {extend:7.3f} s ({extend / number * 1000000000:6.1f} ns/value)")
+        number *= 2
+
+
+if __name__ == "__main__":
+    main()
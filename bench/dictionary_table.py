@@ -0,0 +1,66 @@
+import scent_python as scent
+import gc
+import time
+import tracemalloc
+
+
+def _make_rows(number: int) -> list:
+    """id、名前、金額、有効、登録日時を持つ行のdictを作成する。
+    """
+    names = ["佐藤翔太", "鈴木陽菜", "高橋蓮", "田中結衣", "伊藤大翔", "渡辺さくら"]
+    dates = ["2024/01/05", "2024/02/11", "2024/03/20", "2024/04/01"]
+    return [{"id": index, "name": names[index % names.__len__()], "amount": index * 1.5, "active": index % 3 != 0, "registered": dates[index % dates.__len__()]} for index in range(number)]
+
+
+def _measure(function) -> tuple:
+    """関数が作成したオブジェクトを保持したまま確保されているメモリーのバイト数と、メモリーを追跡せずに実行した秒数を計測する。
+    """
+    gc.collect()
+    start = time.perf_counter()
+    result = function()
+    seconds = time.perf_counter() - start
+    del result
+    gc.collect()
+    tracemalloc.start()
+    result = function()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return (result, size, seconds)
+
+
+def _read(rows: any) -> int:
+    """すべての行の値をDictionaryと同じメソッドで参照する。
+    """
+    total = 0
+    for row in rows:
+        total += row.get_int("id")
+        if row.get_bool("active"):
+            total += 1
+        row.get("name")
+    return total
+
+
+def main(number: int = 1000000):
+    rows = _make_rows(number)
+    typecodes = {"id": "q", "amount": "d", "active": "b"}
+    candidates = (
+        ("list of Dictionary", lambda: [scent.Dictionary(dict(row)) for row in rows]),
+        ("DictionaryTable (lists)", lambda: scent.DictionaryTable.from_dictionaries(rows)),
+        ("DictionaryTable (arrays)", lambda: scent.DictionaryTable.from_dictionaries(rows, typecodes=typecodes)),
+    )
+    expected = None
+    for name, function in candidates:
+        result, size, seconds = _measure(function)
+        start = time.perf_counter()
+        total = _read(result)
+        read = time.perf_counter() - start
+        if expected is None:
+            expected = total
+        elif total != expected:
+            raise AssertionError(name + " returned different values.")
+        print(f"{name:26s} {size / 1048576:9.1f} MiB ({size / number:6.1f} bytes/row)  build {seconds:6.2f} s  read {read:6.2f} s")
+        del result
+
+
+if __name__ == "__main__":
+    main()
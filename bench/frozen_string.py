@@ -0,0 +1,36 @@
+import scent_python as scent
+import random
+import time
+
+
+def _check_normalized_keys():
+    """ひらがな、全角、半角の表記が同じ正規化済みの文字列になることを確認する。
+    """
+    groups = (
+        ("あい", "アイ", "ｱｲ"),
+        ("がぱ", "ガパ", "ｶﾞﾊﾟ"),
+        ("ぁ", "ァ", "ｧ"),
+        ("abc", "ABC", "ａｂｃ", "ＡＢＣ"),
+        ("やまだ たろう", "ヤマダ タロウ", "ﾔﾏﾀﾞ ﾀﾛｳ"),
+    )
+    for group in groups:
+        keys = {scent.FrozenString(value).normalized for value in group}
+        if keys.__len__() != 1:
+            raise AssertionError("normalized keys differ: " + repr(group) + " -> " + repr(keys))
+        if scent.FrozenString.unique(group, True).__len__() != 1:
+            raise AssertionError("unique did not merge: " + repr(group))
+
+
+def main(number: int = 100000):
+    _check_normalized_keys()
+    random.seed(0)
+    readings = ["さとう", "サトウ", "ｻﾄｳ", "すずき", "スズキ", "ｽｽﾞｷ", "たかはし", "タカハシ", "ﾀｶﾊｼ"]
+    values = [random.choice(readings) for index in range(number)]
+    start = time.perf_counter()
+    result = scent.FrozenString.unique(values, True)
+    seconds = time.perf_counter() - start
+    print(f"unique(normalize=True) {number} values -> {result.__len__()} keys  {seconds:7.3f} s")
+
+
+if __name__ == "__main__":
+    main()
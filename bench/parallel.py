@@ -0,0 +1,43 @@
+import scent_python as scent
+import os
+import random
+import time
+
+
+def _make_addresses(number: int) -> list:
+    """全角と半角、ひらがなとカタカナが混在する住所を作成する。
+    """
+    random.seed(0)
+    prefectures = ["東京都", "大阪府", "北海道", "福岡県", "愛知県"]
+    towns = ["ちよだ区", "ｷﾀ区", "なかむら町", "ミナト区", "さかえ"]
+    buildings = ["ＡＢＣマンション", "ｻﾝﾊｲﾂ", "グランドパレス", "さくら荘"]
+    addresses = []
+    for i in range(number):
+        number_part = scent.String(str(random.randint(1, 30)) + "-" + str(random.randint(1, 20))).wide().value
+        addresses.append("　" + random.choice(prefectures) + random.choice(towns) + number_part + " " + random.choice(buildings) + " ")
+    return addresses
+
+
+def main(number: int = 1000000, operations: tuple = ("trim", "narrow", "katakana")):
+    values = _make_addresses(number)
+    normalizer = scent.Normalizer(operations)
+    start = time.perf_counter()
+    expected = list(normalizer.normalize_many(values))
+    single = time.perf_counter() - start
+    print(f"single process {single:8.3f} s")
+    workers = 1
+    while True:
+        with scent.ParallelNormalizer(operations, workers) as parallel:
+            start = time.perf_counter()
+            result = list(parallel.normalize_many(values))
+            seconds = time.perf_counter() - start
+        if result != expected:
+            raise AssertionError("parallel result differs from single process result.")
+        print(f"{workers:3d} workers   {seconds:8.3f} s  x{single / seconds:5.2f}")
+        if workers >= (os.cpu_count() or 1):
+            break
+        workers = min(workers * 2, os.cpu_count() or 1)
+
+
+if __name__ == "__main__":
+    main()
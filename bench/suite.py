@@ -0,0 +1,369 @@
+import scent_python as scent
+import datetime
+import inspect
+import json
+import math
+import platform
+import random
+import re
+import statistics
+import time
+
+
+def make_names(number: int, seed: int = 0) -> list:
+    """漢字の氏名と、ひらがなや半角カタカナのふりがなを混在させた名前を作成する。
+    """
+    generator = random.Random(seed)
+    family_names = [("佐藤", "さとう"), ("鈴木", "ｽｽﾞｷ"), ("高橋", "たかはし"), ("田中", "タナカ"), ("伊藤", "いとう"), ("渡辺", "ﾜﾀﾅﾍﾞ"), ("山本", "やまもと"), ("中村", "ナカムラ")]
+    given_names = [("翔太", "しょうた"), ("陽菜", "ﾋﾅ"), ("蓮", "れん"), ("結衣", "ユイ"), ("大翔", "ひろと"), ("さくら", "さくら"), ("湊", "ﾐﾅﾄ"), ("美咲", "みさき")]
+    names = []
+    for index in range(number):
+        family_name, family_kana = generator.choice(family_names)
+        given_name, given_kana = generator.choice(given_names)
+        separator = generator.choice([" ", "　", ""])
+        names.append(family_name + separator + given_name + "（" + family_kana + separator + given_kana + "）")
+    return names
+
+
+def make_addresses(number: int, seed: int = 0) -> list:
+    """全角と半角の数字、ひらがなとカタカナ、前後の空白が混在する住所を作成する。
+    """
+    generator = random.Random(seed)
+    prefectures = ["東京都", "大阪府", "北海道", "福岡県", "愛知県", "神奈川県"]
+    cities = ["千代田区", "ｷﾀ区", "なかむら区", "ミナト区", "札幌市中央区", "名古屋市中区"]
+    buildings = ["ＡＢＣマンション", "ｻﾝﾊｲﾂ", "グランドパレス", "さくら荘", "Ｓｕｎ　Ｃｏｕｒｔ"]
+    addresses = []
+    for index in range(number):
+        block = str(generator.randint(1, 30)) + "-" + str(generator.randint(1, 20)) + "-" + str(generator.randint(1, 9))
+        if generator.random() < 0.5:
+            block = scent.String(block).wide().value
+        addresses.append(generator.choice(["", " ", "　"]) + generator.choice(prefectures) + generator.choice(cities) + block + " " + generator.choice(buildings) + str(generator.randint(101, 905)) + generator.choice(["", " ", "　"]))
+    return addresses
+
+
+def make_amounts(number: int, seed: int = 0) -> list:
+    """桁区切りや全角数字、円記号を含む金額の文字列を作成する。
+    """
+    generator = random.Random(seed)
+    amounts = []
+    for index in range(number):
+        amount = "{:,}".format(generator.randint(-100000, 10000000))
+        if generator.random() < 0.3:
+            amount = scent.String(amount).wide().value
+        amounts.append(generator.choice(["", "￥", "¥"]) + amount + generator.choice(["", "円", ".00"]))
+    return amounts
+
+
+def make_datetimes(number: int, seed: int = 0) -> list:
+    """Datetime.from_strが解析できる書式の日時の文字列を作成する。
+    """
+    generator = random.Random(seed)
+    formats = [format for regex, format in scent.Datetime.regex_and_formats]
+    start = datetime.datetime(2000, 1, 1)
+    values = []
+    for index in range(number):
+        value = start + datetime.timedelta(seconds=generator.randint(0, 30 * 365 * 86400))
+        values.append(value.strftime(generator.choice(formats)))
+    return values
+
+
+def make_records(number: int, seed: int = 0) -> list:
+    """顧客台帳の1行を表すdictを作成する。
+    """
+    generator = random.Random(seed)
+    names = make_names(number, seed)
+    addresses = make_addresses(number, seed)
+    amounts = make_amounts(number, seed)
+    datetimes = make_datetimes(number, seed)
+    records = []
+    for index in range(number):
+        records.append({
+            "id": str(index + 1),
+            "name": names[index],
+            "address": addresses[index],
+            "amount": amounts[index],
+            "active": generator.choice(["true", "false", "1", "0", "ＴＲＵＥ"]),
+            "registered": datetimes[index],
+        })
+    return records
+
+
+def _strings(values: list):
+    return lambda: [scent.String(value) for value in values]
+
+
+def _string_method(name: str, values: list, *arguments: any) -> tuple:
+    def run(strings: list):
+        for string in strings:
+            getattr(string, name)(*arguments)
+    return ("String." + name, _strings(values), run)
+
+
+def _dictionary(records: list):
+    return lambda: [scent.Dictionary(dict(record)) for record in records]
+
+
+def _dictionary_method(name: str, records: list, *arguments: any) -> tuple:
+    def run(dictionaries: list):
+        for dictionary in dictionaries:
+            getattr(dictionary, name)(*arguments)
+    return ("Dictionary." + name, _dictionary(records), run)
+
+
+def _datetimes(values: list):
+    return lambda: [scent.Datetime(value) for value in values]
+
+
+def _datetime_method(name: str, values: list, *arguments: any) -> tuple:
+    def run(datetimes: list):
+        for one in datetimes:
+            getattr(one, name)(*arguments)
+    return ("Datetime." + name, _datetimes(values), run)
+
+
+def _large_dictionary(records: list):
+    return lambda: scent.Dictionary({record["id"]: record["name"] for record in records})
+
+
+def _indexed_dictionary(records: list):
+    def setup() -> "scent.Dictionary":
+        dictionary = scent.Dictionary({record["id"]: record["name"] for record in records})
+        dictionary.create_sorted_index(True)
+        return dictionary
+    return setup
+
+
+def _value_indexed_dictionary(records: list):
+    def setup() -> "scent.Dictionary":
+        dictionary = scent.Dictionary({record["id"]: record["active"] for record in records})
+        dictionary.create_value_index()
+        return dictionary
+    return setup
+
+
+def _normalize_customers(records: list):
+    for record in records:
+        scent.String(record["name"]).trim().narrow().katakana().upper()
+        scent.String(record["address"]).trim().wide().replace("[ 　]+", "　")
+        scent.String(record["amount"]).narrow().to_int()
+
+
+def _load_ledger(records: list):
+    for record in records:
+        dictionary = scent.Dictionary({})
+        for key, value in record.items():
+            dictionary.put(key, value)
+        dictionary.get_int("id")
+        dictionary.get_bool("active")
+        dictionary.get_datetime("registered").str_date()
+
+
+def _aggregate_by_month(values: list):
+    totals = scent.Dictionary({})
+    for value in values:
+        one = scent.Datetime.from_str(value)
+        if one is not None:
+            key = scent.String(one.get_year()).append("-").append(scent.String(one.get_month()).padding_left("0", 2)).value
+            totals.put(key, (totals.get(key) or 0) + 1)
+    totals.sort_keys()
+
+
+def benchmarks(size: int = 1000) -> list:
+    """(名前, 計測しない準備処理, 計測する処理)のlistを作成する。計測する処理はsize個の値を処理する。
+    """
+    names = make_names(size)
+    addresses = make_addresses(size)
+    amounts = make_amounts(size)
+    datetimes = make_datetimes(size)
+    records = make_records(size)
+    texts = [name + "\r\n" + address + "\n\t" + amount + "\r" for name, address, amount in zip(names, addresses, amounts)]
+    numbers = [scent.String(amount).narrow().value for amount in amounts]
+    booleans = [record["active"] for record in records]
+    decimals = [str(index) + ".000" for index in range(size)]
+    encoded = [value.encode("utf-8") for value in addresses]
+    mapping = {"株式会社": "(株)", "有限会社": "(有)", "マンション": "MS", "ハイツ": "HT"}
+    table = [
+        _string_method("copy", names),
+        _string_method("freeze", names),
+        ("String.iter_chars", _strings(names), lambda strings: [list(string.iter_chars()) for string in strings]),
+        ("String.iter_graphemes", _strings(names), lambda strings: [list(string.iter_graphemes()) for string in strings]),
+        _string_method("window", addresses, 3, 10),
+        _string_method("length", names),
+        _string_method("match", datetimes, "^[0-9]{4}/"),
+        _string_method("insert", names, "様", 2),
+        _string_method("prepend", names, "〒"),
+        _string_method("append", names, "様"),
+        _string_method("padding_left", numbers, "0", 16),
+        _string_method("padding_right", names, "　", 24),
+        _string_method("extract", addresses, 3, 10),
+        _string_method("extract_by_regex", addresses, "[0-9０-９]+"),
+        _string_method("repeat", names, 3),
+        _string_method("replace", addresses, "[ 　]+", ""),
+        _string_method("replace_many", addresses, mapping),
+        _string_method("replace_cr", texts, ""),
+        _string_method("replace_lf", texts, ""),
+        _string_method("replace_crlf", texts, ""),
+        _string_method("replace_tab", texts, " "),
+        _string_method("trim", addresses),
+        _string_method("remove_meaningless_decimal_point", decimals),
+        _string_method("narrow", addresses),
+        _string_method("wide", addresses),
+        _string_method("lower", addresses),
+        _string_method("upper", addresses),
+        _string_method("hiragana", names),
+        _string_method("katakana", names),
+        _string_method("to_bytes", addresses),
+        ("String.from_bytes", lambda: encoded, lambda values: [scent.String.from_bytes(value) for value in values]),
+        ("String.iter_from_bytes", lambda: encoded, lambda values: [list(scent.String.iter_from_bytes(value, "utf-8", 16)) for value in values]),
+        ("String.encode_into", _strings(addresses), lambda strings: [string.encode_into(bytearray(256)) for string in strings]),
+        _string_method("to_int", amounts),
+        _string_method("to_float", amounts),
+        _string_method("to_bool", booleans),
+        _string_method("to_datetime", datetimes),
+        _string_method("split", addresses, "[-－]"),
+        ("String.iter_split", _strings(addresses), lambda strings: [list(string.iter_split("[-－]")) for string in strings]),
+        ("String.iter_matches", _strings(addresses), lambda strings: [list(string.iter_matches("[0-9０-９]+")) for string in strings]),
+        _string_method("sum", numbers),
+        ("String.translator", lambda: None, lambda state: [scent.String.translator("wide_to_narrow") for index in range(size)]),
+        ("String.join", lambda: None, lambda state: scent.String.join(names, "、")),
+        _dictionary_method("copy", records),
+        _dictionary_method("length", records),
+        _dictionary_method("values", records),
+        _dictionary_method("keys", records),
+        _dictionary_method("put", records, "note", "備考"),
+        _dictionary_method("move_to_end", records, "id"),
+        _dictionary_method("add", records, "追加"),
+        _dictionary_method("remove_key", records, "address"),
+        _dictionary_method("remove_value", records, "true"),
+        _dictionary_method("clear", records),
+        _dictionary_method("get", records, "name"),
+        _dictionary_method("get_int", records, "id"),
+        _dictionary_method("get_float", records, "id"),
+        _dictionary_method("get_bool", records, "active"),
+        _dictionary_method("get_datetime", records, "registered"),
+        ("Dictionary.merge", _dictionary(records), lambda dictionaries: [dictionary.merge(dictionaries[0]) for dictionary in dictionaries]),
+        ("Dictionary.sort_keys", _large_dictionary(records), lambda dictionary: dictionary.sort_keys()),
+        ("Dictionary.sort_values", _large_dictionary(records), lambda dictionary: dictionary.sort_values()),
+        ("Dictionary.extend", lambda: scent.Dictionary({}), lambda dictionary: dictionary.extend(names)),
+        ("Dictionary.create_sorted_index", _large_dictionary(records), lambda dictionary: dictionary.create_sorted_index(True)),
+        ("Dictionary.drop_sorted_index", _indexed_dictionary(records), lambda dictionary: dictionary.drop_sorted_index()),
+        ("Dictionary.range_keys", _indexed_dictionary(records), lambda dictionary: [dictionary.range_keys(name, name + "）") for name in names]),
+        ("Dictionary.smallest", _indexed_dictionary(records), lambda dictionary: [dictionary.smallest(10) for index in range(size)]),
+        ("Dictionary.largest", _indexed_dictionary(records), lambda dictionary: [dictionary.largest(10) for index in range(size)]),
+        ("Dictionary.put_indexed", _indexed_dictionary(records), lambda dictionary: [dictionary.put(str(index), name) for index, name in enumerate(names)]),
+        ("Dictionary.create_value_index", _large_dictionary(records), lambda dictionary: dictionary.create_value_index()),
+        ("Dictionary.drop_value_index", _value_indexed_dictionary(records), lambda dictionary: dictionary.drop_value_index()),
+        ("Dictionary.keys_for", _value_indexed_dictionary(records), lambda dictionary: [dictionary.keys_for(value) for value in booleans]),
+        ("Dictionary.remove_value_indexed", _value_indexed_dictionary(records), lambda dictionary: [dictionary.remove_value(value) for value in booleans]),
+        ("Dictionary.iterate", _large_dictionary(records), lambda dictionary: [item for item in dictionary]),
+        ("Dictionary.keys_view", _large_dictionary(records), lambda dictionary: [key for key in dictionary.keys_view()]),
+        ("Dictionary.values_view", _large_dictionary(records), lambda dictionary: [value for value in dictionary.values_view()]),
+        ("Dictionary.items_view", _large_dictionary(records), lambda dictionary: [item for item in dictionary.items_view()]),
+        ("Datetime.__init__", lambda: datetimes, lambda values: [scent.Datetime(value) for value in values]),
+        _datetime_method("equals_date", datetimes, "2015/06/15"),
+        _datetime_method("equals_time", datetimes, "12:30:00"),
+        _datetime_method("copy", datetimes),
+        _datetime_method("modify", datetimes, None, None, 1),
+        _datetime_method("add", datetimes, None, None, 10, 1),
+        _datetime_method("get_year", datetimes),
+        _datetime_method("get_month", datetimes),
+        _datetime_method("get_day", datetimes),
+        _datetime_method("get_hour", datetimes),
+        _datetime_method("get_minute", datetimes),
+        _datetime_method("get_second", datetimes),
+        _datetime_method("get_microsecond", datetimes),
+        _datetime_method("get_weekday", datetimes),
+        _datetime_method("str_date", datetimes),
+        _datetime_method("str_time", datetimes),
+        ("Datetime.from_str", lambda: datetimes, lambda values: [scent.Datetime.from_str(value) for value in values]),
+        ("Datetime.years_list", lambda: None, lambda state: [scent.Datetime.years_list(2024) for index in range(size)]),
+        ("Datetime.months_list", lambda: None, lambda state: [scent.Datetime.months_list() for index in range(size)]),
+        ("macro.normalize_customers", lambda: records, _normalize_customers),
+        ("macro.load_ledger", lambda: records, _load_ledger),
+        ("macro.aggregate_by_month", lambda: datetimes, _aggregate_by_month),
+        ("macro.load_ledger_with_schema", lambda: records, lambda values: scent.RecordSchema({"id": int, "active": bool, "registered": "datetime", "name": str}).to_records(values)),
+    ]
+    return table
+
+
+def uncovered(table: list) -> list:
+    """String、Dictionary、Datetimeの公開メソッドのうち、計測されていないもののlistを取得する。
+    """
+    names = {name for name, setup, run in table}
+    result = []
+    for cls in (scent.String, scent.Dictionary, scent.Datetime):
+        for name, member in inspect.getmembers(cls, inspect.isfunction):
+            if name.startswith("_") or hasattr(scent.Object, name):
+                continue
+            if cls.__name__ + "." + name not in names:
+                result.append(cls.__name__ + "." + name)
+    return result
+
+
+def measure(setup, run, samples: int, operations: int) -> dict:
+    """準備処理のあとに計測する処理をsamples回実行し、1回の処理あたりの秒数の平均、中央値、99パーセンタイルを求める。
+    """
+    run(setup())
+    durations = []
+    for index in range(samples):
+        state = setup()
+        start = time.perf_counter()
+        run(state)
+        durations.append((time.perf_counter() - start) / operations)
+    durations.sort()
+    return {
+        "mean": statistics.fmean(durations),
+        "p50": statistics.median(durations),
+        "p99": durations[min(durations.__len__() - 1, math.ceil(durations.__len__() * 0.99) - 1)],
+        "samples": samples,
+        "operations": operations,
+    }
+
+
+def run(pattern: str = None, samples: int = 20, size: int = 1000, output=None) -> dict:
+    """ベンチマークを実行して結果のdictを作成する。patternを指定すると名前が一致するものだけを実行する。
+    """
+    regex = None if pattern is None else re.compile(pattern)
+    results = {}
+    for name, setup, function in benchmarks(size):
+        if regex is not None and regex.search(name) is None:
+            continue
+        results[name] = measure(setup, function, samples, size)
+        if output is not None:
+            output.write(f"{name:45s} p50 {results[name]['p50'] * 1000000:10.3f} us\n")
+            output.flush()
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "size": size,
+        "unit": "seconds per operation",
+        "benchmarks": results,
+    }
+
+
+def compare(result: dict, baseline: dict, threshold: float = 0.2, metric: str = "p50") -> list:
+    """保存された結果と比較し、thresholdの割合を超えて遅くなったベンチマークの(名前, 基準値, 計測値, 比率)のlistを取得する。
+    """
+    regressions = []
+    for name, current in result["benchmarks"].items():
+        previous = baseline["benchmarks"].get(name)
+        if previous is None or previous[metric] <= 0:
+            continue
+        ratio = current[metric] / previous[metric]
+        if ratio > 1 + threshold:
+            regressions.append((name, previous[metric], current[metric], ratio))
+    return regressions
+
+
+def load(path: str) -> dict:
+    """JSONで保存された結果を読み込む。
+    """
+    with open(path, "r", encoding="utf-8") as file:
+        return json.load(file)
+
+
+def save(result: dict, path: str):
+    """結果をJSONで保存する。
+    """
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(result, file, ensure_ascii=False, indent=2)
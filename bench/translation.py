@@ -0,0 +1,63 @@
+import scent_python as scent
+import random
+import timeit
+
+
+def _legacy_convert(value: str, table: dict) -> str:
+    """変換表を1文字ずつ参照する従来の変換処理。
+    """
+    result = ""
+    for one in value:
+        if one in table.keys():
+            result += table[one]
+        else:
+            result += one
+    return result
+
+
+def _make_values(number: int, length: int, ratio: float) -> list:
+    """変換表のキーを指定の割合で漢字に混在させた文字列を作成する。
+    """
+    random.seed(0)
+    keys = []
+    for name in ("wide_to_narrow", "narrow_to_wide", "katakana_to_hiragana", "hiragana_to_katakana"):
+        keys.extend(key for key in getattr(scent.String, name + "_dict").keys() if len(key) == 1)
+    kanji = list("山田太郎花子佐藤鈴木高橋東京都大阪府千代田区株式会社")
+    values = []
+    for i in range(number):
+        value = []
+        for j in range(length):
+            if random.random() < ratio:
+                value.append(random.choice(keys))
+            else:
+                value.append(random.choice(kanji))
+        values.append("".join(value))
+    return values
+
+
+def main(number: int = 1000, length: int = 200, repeat: int = 3):
+    methods = (
+        ("narrow", "wide_to_narrow", lambda value: value),
+        ("wide", "narrow_to_wide", lambda value: value),
+        ("lower", "upper_to_lower", lambda value: value.lower()),
+        ("upper", "lower_to_upper", lambda value: value.upper()),
+        ("hiragana", "katakana_to_hiragana", lambda value: value),
+        ("katakana", "hiragana_to_katakana", lambda value: value),
+    )
+    for ratio in (1.0, 0.1, 0.0):
+        values = _make_values(number, length, ratio)
+        print(f"ratio of table characters: {ratio}")
+        for method, name, prepare in methods:
+            table = getattr(scent.String, name + "_dict")
+            single_table = {key: value for key, value in table.items() if len(key) == 1}
+            translator = scent.Translator(single_table)
+            for value in values:
+                if _legacy_convert(prepare(value), table) != translator.translate(prepare(value)):
+                    raise AssertionError(method + " differs from legacy output: " + value)
+            legacy = min(timeit.repeat(lambda: [_legacy_convert(prepare(value), table) for value in values], number=1, repeat=repeat))
+            current = min(timeit.repeat(lambda: [getattr(scent.String(value), method)().value for value in values], number=1, repeat=repeat))
+            print(f"  {method:10s} legacy {legacy * 1000:9.2f} ms  translator {current * 1000:9.2f} ms  x{legacy / current:7.1f}")
+
+
+if __name__ == "__main__":
+    main()
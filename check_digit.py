@@ -0,0 +1,164 @@
+import scent_python as scent
+import array
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class CheckDigit(scent.Object):
+    """JANコードや口座番号などのチェックデジットを計算、検証する静的関数のクラス。
+    数字は事前に作成した変換表で各桁の値のバイト列に変換され、重みごとのスライスの合計から加重和を求める。
+    重みは右端の桁(チェックデジットを除く)から順に繰り返して適用される。
+    """
+
+    @staticmethod
+    def digit_sum(value: any) -> int:
+        """値に含まれる半角数字1桁をすべて加算した和を求める。String.sumと同じ結果になる。
+        """
+        return sum(str(value).encode("ascii", "ignore").translate(CheckDigit.digit_sum_table))
+
+    @staticmethod
+    def _to_digits(value: any, narrow: bool) -> bytes:
+        text = str(value)
+        if text.isascii() == False:
+            if narrow == False:
+                return None
+            text = scent.String.translator("wide_to_narrow").translate(text)
+            if text.isascii() == False:
+                return None
+        digits = text.encode("ascii")
+        if digits.isdigit() == False:
+            return None
+        return digits.translate(CheckDigit.digit_value_table)
+
+    @staticmethod
+    def _weighted_sum(digits: bytes, weights: tuple) -> int:
+        reversed_digits = digits[::-1]
+        step = weights.__len__()
+        total = 0
+        for index, weight in enumerate(weights):
+            total += weight * sum(reversed_digits[index::step])
+        return total
+
+    @staticmethod
+    def _from_total(total: int, modulus: int) -> int:
+        check_digit = (modulus - total % modulus) % modulus
+        if check_digit >= 10:
+            return 0
+        return check_digit
+
+    @staticmethod
+    def compute(value: any, modulus: int = 10, weights: tuple = (3, 1), narrow: bool = True) -> int:
+        """チェックデジットを含まない数字列のチェックデジットを計算する。数字以外を含む場合はNoneを返す。
+        modulusから加重和の剰余を引いた値が10以上になる場合は0を返す。
+        """
+        digits = CheckDigit._to_digits(value, narrow)
+        if digits is None:
+            return None
+        return CheckDigit._from_total(CheckDigit._weighted_sum(digits, weights), modulus)
+
+    @staticmethod
+    def validate(value: any, modulus: int = 10, weights: tuple = (3, 1), narrow: bool = True) -> bool:
+        """末尾の1桁がチェックデジットとして正しいか検証する。
+        """
+        digits = CheckDigit._to_digits(value, narrow)
+        if digits is None or digits.__len__() < 2:
+            return False
+        return CheckDigit._from_total(CheckDigit._weighted_sum(digits[:-1], weights), modulus) == digits[-1]
+
+    @staticmethod
+    def modulus10(value: any) -> int:
+        """JANコードなどで使用されるモジュラス10ウェイト3・1のチェックデジットを計算する。
+        """
+        return CheckDigit.compute(value, 10, CheckDigit.modulus10_weights)
+
+    @staticmethod
+    def modulus11(value: any) -> int:
+        """モジュラス11ウェイト2～7のチェックデジットを計算する。
+        """
+        return CheckDigit.compute(value, 11, CheckDigit.modulus11_weights)
+
+    @staticmethod
+    def compute_many(values: any, modulus: int = 10, weights: tuple = (3, 1), narrow: bool = True, use_numpy: bool = False) -> tuple:
+        """複数の値のチェックデジットを計算し、array('b')と失敗したインデックスのlistのtupleを返す。失敗した要素は-1になる。
+        use_numpyにTrueを指定すると桁数ごとに行列演算で計算し、numpyの配列を返す。
+        """
+        if use_numpy:
+            return CheckDigit._compute_many_numpy(values, modulus, weights, narrow, False)
+        result = array.array("b")
+        failures = []
+        to_digits = CheckDigit._to_digits
+        weighted_sum = CheckDigit._weighted_sum
+        from_total = CheckDigit._from_total
+        for index, value in enumerate(values):
+            digits = to_digits(value, narrow)
+            if digits is None:
+                result.append(-1)
+                failures.append(index)
+                continue
+            result.append(from_total(weighted_sum(digits, weights), modulus))
+        return (result, failures)
+
+    @staticmethod
+    def validate_many(values: any, modulus: int = 10, weights: tuple = (3, 1), narrow: bool = True, use_numpy: bool = False) -> tuple:
+        """複数の値の末尾の1桁を検証し、array('b')と数字列として解釈できなかったインデックスのlistのtupleを返す。
+        正しい要素は1、誤っている要素と失敗した要素は0になる。
+        """
+        if use_numpy:
+            return CheckDigit._compute_many_numpy(values, modulus, weights, narrow, True)
+        result = array.array("b")
+        failures = []
+        to_digits = CheckDigit._to_digits
+        weighted_sum = CheckDigit._weighted_sum
+        from_total = CheckDigit._from_total
+        for index, value in enumerate(values):
+            digits = to_digits(value, narrow)
+            if digits is None or digits.__len__() < 2:
+                result.append(0)
+                failures.append(index)
+                continue
+            result.append(from_total(weighted_sum(digits[:-1], weights), modulus) == digits[-1])
+        return (result, failures)
+
+    @staticmethod
+    def _compute_many_numpy(values: any, modulus: int, weights: tuple, narrow: bool, validate: bool) -> tuple:
+        if numpy is None:
+            raise ModuleNotFoundError("Requires installation of numpy!")
+        minimum_length = 2 if validate else 1
+        groups = {}
+        failures = []
+        count = 0
+        for index, value in enumerate(values):
+            count += 1
+            digits = CheckDigit._to_digits(value, narrow)
+            if digits is None or digits.__len__() < minimum_length:
+                failures.append(index)
+                continue
+            group = groups.get(digits.__len__())
+            if group is None:
+                group = ([], [])
+                groups[digits.__len__()] = group
+            group[0].append(index)
+            group[1].append(digits)
+        result = numpy.full(count, 0 if validate else -1, dtype=numpy.int8)
+        for length, (indexes, digits) in groups.items():
+            matrix = numpy.frombuffer(b"".join(digits), dtype=numpy.uint8).reshape(-1, length)
+            data_length = length - 1 if validate else length
+            vector = numpy.array([weights[index % weights.__len__()] for index in range(data_length)][::-1], dtype=numpy.int64)
+            totals = matrix[:, :data_length] @ vector
+            check_digits = (modulus - totals % modulus) % modulus
+            check_digits[check_digits >= 10] = 0
+            if validate:
+                result[indexes] = check_digits == matrix[:, -1]
+            else:
+                result[indexes] = check_digits
+        return (result, failures)
+
+    modulus10_weights = (3, 1)
+
+    modulus11_weights = (2, 3, 4, 5, 6, 7)
+
+    digit_value_table = bytes.maketrans(b"0123456789", bytes(range(10)))
+
+    digit_sum_table = bytes(48) + bytes(range(10)) + bytes(198)
@@ -0,0 +1,151 @@
+import scent_python as scent
+import collections
+import sys
+import threading
+import weakref
+
+
+class _CounterOwner:
+
+    __slots__ = ("__weakref__",)
+
+
+class ConversionCache(scent.Object):
+    """変換処理の結果を(変換処理, 入力した文字列)をキーとして保持するクラス。
+    保持数または文字列の合計バイト数が上限を超えた場合は最も長く使われていない結果から破棄される。
+    追加と破棄はロックで保護され、ヒットした場合の参照はロックを取得せずに行われる。ヒット数とミス数はスレッドごとに数えられ、statisticsで合計される。
+    終了したスレッドの数は合計に加算されてから破棄されるため、スレッドを作成し続けても数える領域は増え続けない。
+    """
+
+    def __init__(self, max_entries: int = 100000, max_bytes: int = 67108864):
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._results = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self._bytes = 0
+        self._local = threading.local()
+        self._counters = {}
+        self._retired = [0, 0]
+        self._baseline = (0, 0)
+
+    @property
+    def max_entries(self) -> int:
+        return self._max_entries
+
+    @max_entries.setter
+    def max_entries(self, max_entries: int):
+        with self._lock:
+            self._max_entries = max_entries
+            self._evict()
+
+    @property
+    def max_bytes(self) -> int:
+        return self._max_bytes
+
+    @max_bytes.setter
+    def max_bytes(self, max_bytes: int):
+        with self._lock:
+            self._max_bytes = max_bytes
+            self._evict()
+
+    def length(self) -> int:
+        """保持している結果の数を取得する。
+        """
+        return self._results.__len__()
+
+    def get(self, operations: tuple, value: str) -> str:
+        """保持している変換結果を取得する。保持していない場合はNoneを返す。
+        """
+        counter = self._counter()
+        key = (operations, value)
+        entry = self._results.get(key)
+        if entry is None:
+            counter[1] += 1
+            return None
+        try:
+            self._results.move_to_end(key)
+        except KeyError:
+            pass
+        counter[0] += 1
+        return entry[0]
+
+    def _counter(self) -> list:
+        try:
+            return self._local.counter
+        except AttributeError:
+            counter = [0, 0]
+            owner = _CounterOwner()
+            with self._lock:
+                self._counters[id(owner)] = counter
+            weakref.finalize(owner, ConversionCache._retire, weakref.ref(self), id(owner))
+            self._local.owner = owner
+            self._local.counter = counter
+            return counter
+
+    @staticmethod
+    def _retire(reference: weakref.ref, key: int):
+        cache = reference()
+        if cache is None:
+            return
+        with cache._lock:
+            counter = cache._counters.pop(key, None)
+            if counter is not None:
+                cache._retired[0] += counter[0]
+                cache._retired[1] += counter[1]
+
+    def put(self, operations: tuple, value: str, result: str):
+        """変換結果を保持する。
+        """
+        key = (operations, value)
+        size = sys.getsizeof(value) + sys.getsizeof(result)
+        with self._lock:
+            previous = self._results.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous[1]
+            self._results[key] = (result, size)
+            self._bytes += size
+            self._evict()
+
+    def convert(self, operations: tuple, value: str, function) -> str:
+        """保持している変換結果を取得する。保持していない場合はfunctionで変換した結果を保持してから返す。
+        """
+        result = self.get(operations, value)
+        if result is None:
+            result = function(value)
+            self.put(operations, value, result)
+        return result
+
+    def _evict(self):
+        while self._results.__len__() > 0 and (self._results.__len__() > self._max_entries or self._bytes > self._max_bytes):
+            key, entry = self._results.popitem(last=False)
+            self._bytes -= entry[1]
+
+    def _count(self) -> tuple:
+        hits = self._retired[0]
+        misses = self._retired[1]
+        for counter in self._counters.values():
+            hits += counter[0]
+            misses += counter[1]
+        return (hits, misses)
+
+    def statistics(self) -> dict:
+        """ヒット数、ミス数、保持数、保持している文字列の合計バイト数を取得する。
+        """
+        with self._lock:
+            hits, misses = self._count()
+            return {
+                "hits": hits - self._baseline[0],
+                "misses": misses - self._baseline[1],
+                "length": self._results.__len__(),
+                "bytes": self._bytes,
+                "max_entries": self._max_entries,
+                "max_bytes": self._max_bytes,
+            }
+
+    def clear(self):
+        """保持しているすべての結果と統計を破棄する。
+        """
+        with self._lock:
+            self._results.clear()
+            self._bytes = 0
+            self._baseline = self._count()
@@ -1,6 +1,7 @@
 import scent_python as scent
 import datetime
 import math
+import re
 
 
 class Datetime(scent.Object):
@@ -13,6 +14,17 @@ class Datetime(scent.Object):
 
     default_datetime_format = date_format + " " + time_format
 
+    regex_and_formats = (
+        (re.compile("^[0-9]{4}/[0-1]{1}[0-9]{1}/[0-3]{1}[0-9]{1}$"), "%Y/%m/%d"),
+        (re.compile("^[0-9]{4}\\-[0-1]{1}[0-9]{1}\\-[0-3]{1}[0-9]{1}$"), "%Y-%m-%d"),
+        (re.compile("^[0-9]{4}/[0-1]{1}[0-9]{1}/[0-3]{1}[0-9]{1} [0-2]{1}[0-9]{1}:[0-5]{1}[0-9]{1}$"), "%Y/%m/%d %H:%M"),
+        (re.compile("^[0-9]{4}\\-[0-1]{1}[0-9]{1}\\-[0-3]{1}[0-9]{1} [0-2]{1}[0-9]{1}:[0-5]{1}[0-9]{1}$"), "%Y-%m-%d %H:%M"),
+        (re.compile("^[0-9]{4}/[0-1]{1}[0-9]{1}/[0-3]{1}[0-9]{1} [0-2]{1}[0-9]{1}:[0-5]{1}[0-9]{1}:[0-5]{1}[0-9]{1}$"), "%Y/%m/%d %H:%M:%S"),
+        (re.compile("^[0-9]{4}\\-[0-1]{1}[0-9]{1}\\-[0-3]{1}[0-9]{1} [0-2]{1}[0-9]{1}:[0-5]{1}[0-9]{1}:[0-5]{1}[0-9]{1}$"), "%Y-%m-%d %H:%M:%S"),
+        (re.compile("^[0-2]{1}[0-9]{1}:[0-5]{1}[0-9]{1}:[0-5]{1}[0-9]{1}$"), "%H:%M:%S"),
+        (re.compile("^[0-2]{1}[0-9]{1}:[0-5]{1}[0-9]{1}$"), "%H:%M"),
+    )
+
     def __init__(self, value: any = None, format: str = default_datetime_format):
         if value is None:
             value = datetime.datetime.now()
@@ -221,22 +233,10 @@ class Datetime(scent.Object):
         """
         string = scent.String(str)
         format = None
-        if string.match("^[0-9]{4}/[0-1]{1}[0-9]{1}/[0-3]{1}[0-9]{1}$"):
-            format = "%Y/%m/%d"
-        if string.match("^[0-9]{4}\\-[0-1]{1}[0-9]{1}\\-[0-3]{1}[0-9]{1}$"):
-            format = "%Y-%m-%d"
-        if string.match("^[0-9]{4}/[0-1]{1}[0-9]{1}/[0-3]{1}[0-9]{1} [0-2]{1}[0-9]{1}:[0-5]{1}[0-9]{1}$"):
-            format = "%Y/%m/%d %H:%M"
-        if string.match("^[0-9]{4}\\-[0-1]{1}[0-9]{1}\\-[0-3]{1}[0-9]{1} [0-2]{1}[0-9]{1}:[0-5]{1}[0-9]{1}$"):
-            format = "%Y-%m-%d %H:%M"
-        if string.match("^[0-9]{4}/[0-1]{1}[0-9]{1}/[0-3]{1}[0-9]{1} [0-2]{1}[0-9]{1}:[0-5]{1}[0-9]{1}:[0-5]{1}[0-9]{1}$"):
-            format = "%Y/%m/%d %H:%M:%S"
-        if string.match("^[0-9]{4}\\-[0-1]{1}[0-9]{1}\\-[0-3]{1}[0-9]{1} [0-2]{1}[0-9]{1}:[0-5]{1}[0-9]{1}:[0-5]{1}[0-9]{1}$"):
-            format = "%Y-%m-%d %H:%M:%S"
-        if string.match("^[0-2]{1}[0-9]{1}:[0-5]{1}[0-9]{1}:[0-5]{1}[0-9]{1}$"):
-            format = "%H:%M:%S"
-        if string.match("^[0-2]{1}[0-9]{1}:[0-5]{1}[0-9]{1}$"):
-            format = "%H:%M"
+        for regex, one in Datetime.regex_and_formats:
+            if string.match(regex):
+                format = one
+                break
         try:
             return scent.Datetime(datetime.datetime.strptime(string.value, format), format)
         except (TypeError, ValueError):
@@ -1,14 +1,23 @@
 import scent_python as scent
+import bisect
+import itertools
+import operator
 
 
 class Dictionary(scent.Object):
     """連想配列のクラス。
+    要素の順序はdictの挿入順で保持され、並び替えはdictを並び替えた順序で再構築して行われる。
     """
 
-    def __init__(self, value: dict = {}):
+    def __init__(self, value: dict = None):
+        if value is None:
+            value = {}
         self._dict = value
-        self._keys = list(value.keys())
+        self._next_key = 0
+        self._sorted_index = None
+        self._value_index = None
         self._iterate_index = -1
+        self._iterate_keys = ()
 
     @property
     def dict(self) -> dict:
@@ -17,40 +26,39 @@ class Dictionary(scent.Object):
     @dict.setter
     def dict(self, value: dict):
         self._dict = value
-        self._keys = list(value.keys())
-
-    @property
-    def keys(self) -> list:
-        return self._keys
+        self._next_key = 0
+        if self._sorted_index is not None:
+            self.create_sorted_index(self._sorted_index[0], self._sorted_index[1])
+        if self._value_index is not None:
+            self.create_value_index()
 
     def __repr__(self) -> str:
-        dict = {}
-        for key, value in self:
-            dict[key] = value
-        return repr(dict)
+        return repr(self._dict)
 
     def __str__(self) -> str:
-        dict = {}
-        for key, value in self:
-            dict[key] = value
-        return str(dict)
+        return str(self._dict)
 
     def __eq__(self, other: object) -> bool:
-        return self.dict == other
+        if isinstance(other, Dictionary):
+            return self._dict == other._dict
+        return self._dict == other
 
     @property
     def iterate_index(self) -> int:
         return self._iterate_index
 
-    def __iter__(self) -> "Dictionary":
-        return self
+    def __iter__(self):
+        return iter(self._dict.items())
 
     def __next__(self) -> tuple:
-        if self.length() - 1 <= self.iterate_index:
+        if self._iterate_index == -1:
+            self._iterate_keys = tuple(self._dict)
+        if self._iterate_keys.__len__() - 1 <= self._iterate_index:
             self._iterate_index = -1
+            self._iterate_keys = ()
             raise StopIteration()
         self._iterate_index += 1
-        key = self._keys[self.iterate_index]
+        key = self._iterate_keys[self._iterate_index]
         return (key, self.get(key))
 
     def copy(self) -> "Dictionary":
@@ -63,120 +71,320 @@ class Dictionary(scent.Object):
         """
         return self.dict.__len__()
 
+    def keys_view(self):
+        """配列内のすべてのキーを複製せずに参照するビューを取得する。ビューは配列の変更に追従する。
+        """
+        return self._dict.keys()
+
+    def values_view(self):
+        """配列内のすべての値を複製せずに参照するビューを取得する。ビューは配列の変更に追従する。
+        """
+        return self._dict.values()
+
+    def items_view(self):
+        """配列内のすべての(キー, 値)を複製せずに参照するビューを取得する。ビューは配列の変更に追従する。
+        """
+        return self._dict.items()
+
     def values(self) -> tuple:
         """配列内のすべての値を取得する。
         """
-        values = []
-        for key in self._keys:
-            values.append(self.get(key))
-        return tuple(values)
+        return tuple(self._dict.values())
 
     def keys(self) -> tuple:
         """配列内のすべてのキーを取得する。
         """
-        return tuple(self._keys)
+        return tuple(self._dict)
 
     def put(self, key: str, dict: any):
         """配列に値を配置する。
         """
-        self.dict[key] = dict
-        if key in self._keys == False:
-            self._keys.append(key)
+        if self._sorted_index is not None:
+            self._add_to_sorted_index(key, dict)
+        if self._value_index is not None:
+            if key in self._dict:
+                self._remove_from_value_index(key, self._dict[key])
+            self._add_to_value_index(key, dict)
+        self._dict[key] = dict
+
+    def _remove_from_indexes(self, key: any, value: any):
+        if self._sorted_index is not None:
+            self._remove_from_sorted_index(key)
+        if self._value_index is not None:
+            self._remove_from_value_index(key, value)
+
+    def move_to_end(self, key: str, last: bool = True):
+        """指定されたキーの要素を末尾に移動する。lastにFalseを指定すると先頭に移動する。
+        末尾への移動は要素数によらず一定の時間で行われ、先頭への移動は配列を再構築する。
+        """
+        if key not in self._dict:
+            return
+        if last:
+            self._dict[key] = self._dict.pop(key)
+            return
+        items = list(self._dict.items())
+        value = self._dict[key]
+        self._dict.clear()
+        self._dict[key] = value
+        self._dict.update(items)
 
     def add(self, value: any):
         """配列に値を追加する。キーはintで自動採番される。
+        採番は要素数と前回までに採番した番号の大きい方から始まり、使用されていない番号の文字列がキーになる。
         """
-        key = self.length()
-        while key in self.keys():
-            key += 1
-        self.put(str(key), value)
+        self.extend((value,))
+
+    def extend(self, values: any):
+        """複数の値を順番に配列に追加する。キーはaddと同じ方法で自動採番される。
+        """
+        dictionary = self._dict
+        put = dictionary.__setitem__
+        if self._sorted_index is not None or self._value_index is not None:
+            put = self.put
+        number = max(self._next_key, dictionary.__len__())
+        for value in values:
+            key = str(number)
+            while key in dictionary:
+                number += 1
+                key = str(number)
+            put(key, value)
+            number += 1
+        self._next_key = number
 
     def remove_key(self, key: str):
         """指定されたキーに一致する配列の要素を削除する。
         """
         try:
-            del self.dict[key]
-            self._keys.remove(key)
-        except (KeyError, ValueError):
-            pass
+            value = self._dict.pop(key)
+        except KeyError:
+            return
+        if self._sorted_index is not None or self._value_index is not None:
+            self._remove_from_indexes(key, value)
 
     def remove_value(self, dict: any):
-        """指定された値を配列からすべて削除する。
+        """指定された値を配列からすべて削除する。値の索引がある場合は一致する要素の数に比例する時間で削除される。
         """
+        if self._value_index is not None:
+            for key in self.keys_for(dict):
+                self.remove_key(key)
+            return
         try:
-            for key in self.keys():
-                if dict == self.get(key):
-                    del self.dict[key]
-                    self._keys.remove(key)
+            for key in [key for key, value in self._dict.items() if dict == value]:
+                self.remove_key(key)
         except TypeError:
             pass
 
     def clear(self):
         """配列からすべての要素を削除する。
         """
-        self.dict.clear()
-        self._keys.clear()
+        self._dict.clear()
+        self._next_key = 0
+        if self._sorted_index is not None:
+            self._sorted_index[2].clear()
+            self._sorted_index[3].clear()
+            self._sorted_index[4].clear()
+        if self._value_index is not None:
+            self._value_index[0].clear()
+            self._value_index[1].clear()
 
     def get(self, key: str) -> any:
         """配列の値を取得する。
         """
         try:
-            return self.dict[key]
+            return self._dict[key]
         except KeyError:
             return None
 
     def get_int(self, key: str) -> int:
         """配列の値をintとして取得する。
         """
-        return scent.String(self.get(key)).to_int()
+        return scent.NumberParser.to_int(self.get(key), False)
 
     def get_float(self, key: str) -> float:
         """配列の値をfloatとして取得する。
         """
-        return scent.String(self.get(key)).to_float()
+        return scent.NumberParser.to_float(self.get(key), False)
 
     def get_bool(self, key: str) -> bool:
         """配列の値をboolとして取得する。
         """
-        return scent.String(self.get(key)).to_bool()
+        return scent.NumberParser.to_bool(self.get(key), False)
 
     def get_datetime(self, key: str) -> "scent.Datetime":
         """配列の値をDatetimeとして取得する。
         """
         return scent.Datetime(self.get(key))
 
-    def merge(self, *dictionaries: "Dictionary"):
-        """ほかの配列を結合する。キーが重複する場合、あとの値で上書きされる。
+    def merge(self, *dictionaries: "Dictionary | dict"):
+        """ほかの配列またはdictを結合する。キーが重複する場合、あとの値で上書きされる。
         """
         for dictionary in dictionaries:
-            for key in dictionary.keys():
-                self.put(key, dictionary.get(key))
+            source = dictionary.dict if isinstance(dictionary, Dictionary) else dictionary
+            if self._sorted_index is None and self._value_index is None:
+                self._dict.update(source)
+            else:
+                for key, value in source.items():
+                    self.put(key, value)
+
+    def _reorder(self, items: list):
+        self._dict.clear()
+        self._dict.update(items)
 
-    def sort_keys(self, reverse: bool = False):
-        """配列をキーで並び替える。
+    def sort_keys(self, reverse: bool = False, key=None):
+        """配列をキーで並び替える。keyを指定すると、キーを引数にした関数の戻り値で並び替える。
         """
-        keys = list(self.keys())
-        keys.sort(reverse=reverse)
-        self._keys = keys
+        if key is None:
+            self._reorder(sorted(self._dict.items(), key=operator.itemgetter(0), reverse=reverse))
+        else:
+            self._reorder(sorted(self._dict.items(), key=lambda item: key(item[0]), reverse=reverse))
 
-    def sort_values(self, reverse: bool = False):
-        """配列を値で並び替える。
+    def sort_values(self, reverse: bool = False, key=None):
+        """配列を値で並び替える。値が等しい要素は元の順序が維持される。
+        keyを指定すると、値を引数にした関数の戻り値で並び替える。tupleを返す関数を指定すると複数の項目で一度に並び替えられる。
         """
-        value_and_keys = {}
-        for key, value in self:
-            keys = []
-            value_id = id(value)
-            if value_id in value_and_keys.keys():
-                keys = value_and_keys[value_id]
-            else:
-                value_and_keys[value_id] = keys
-            keys.append(key)
-        values = list(self.values())
-        values.sort(reverse=reverse)
-        keys_for_sort = []
-        for value in values:
-            value_id = id(value)
-            keys = value_and_keys[value_id]
-            for key in keys:
-                keys_for_sort.append(key)
-        self._keys = keys_for_sort
+        if key is None:
+            self._reorder(sorted(self._dict.items(), key=operator.itemgetter(1), reverse=reverse))
+        else:
+            self._reorder(sorted(self._dict.items(), key=lambda item: key(item[1]), reverse=reverse))
+
+    def create_sorted_index(self, by_value: bool = False, key=None):
+        """キーまたは値で並び替えた順序を保持する索引を作成する。keyを指定すると関数の戻り値で並び替える。
+        索引はput、remove_key、remove_value、merge、add、extend、clearによる変更に合わせて二分探索で更新され、
+        range_keys、smallest、largestで並び替えずに参照できる。並び替えに使用する値が等しい要素は索引に追加された順に並ぶ。
+        索引の値と比較できない値をputした場合はTypeErrorが発生し、配列と索引は変更されない。
+        """
+        items = list(self._dict.items())
+        position = 1 if by_value else 0
+        if key is None:
+            sort_keys = [item[position] for item in items]
+        else:
+            sort_keys = [key(item[position]) for item in items]
+        order = sorted(range(items.__len__()), key=sort_keys.__getitem__)
+        entries = [(sort_keys[index], index) for index in order]
+        keys = [items[index][0] for index in order]
+        self._sorted_index = (by_value, key, entries, keys, dict(zip(keys, entries)), itertools.count(items.__len__()))
+
+    def drop_sorted_index(self):
+        """create_sorted_indexで作成した索引を破棄する。
+        """
+        self._sorted_index = None
+
+    def _sort_key(self, key: any, value: any) -> any:
+        by_value, function = self._sorted_index[:2]
+        target = value if by_value else key
+        if function is None:
+            return target
+        return function(target)
+
+    def _add_to_sorted_index(self, key: any, value: any):
+        by_value, function, entries, keys, positions, sequence = self._sorted_index
+        entry = (self._sort_key(key, value), next(sequence))
+        index = bisect.bisect_right(entries, entry)
+        previous = positions.get(key)
+        if previous is not None:
+            previous_index = bisect.bisect_left(entries, previous)
+            del entries[previous_index]
+            del keys[previous_index]
+            if previous_index < index:
+                index -= 1
+        entries.insert(index, entry)
+        keys.insert(index, key)
+        positions[key] = entry
+
+    def _remove_from_sorted_index(self, key: any):
+        by_value, function, entries, keys, positions, sequence = self._sorted_index
+        entry = positions.pop(key, None)
+        if entry is None:
+            return
+        index = bisect.bisect_left(entries, entry)
+        del entries[index]
+        del keys[index]
+
+    def _get_sorted_index(self) -> tuple:
+        if self._sorted_index is None:
+            raise ValueError("Sorted index has not been created.")
+        return self._sorted_index
+
+    def range_keys(self, start: any = None, end: any = None) -> list:
+        """索引の並び替えに使用する値がstart以上end未満の要素のキーのlistを、索引の順序で取得する。
+        """
+        by_value, function, entries, keys = self._get_sorted_index()[:4]
+        start_index = 0
+        if start is not None:
+            start_index = bisect.bisect_left(entries, (start,))
+        end_index = keys.__len__()
+        if end is not None:
+            end_index = bisect.bisect_left(entries, (end,), start_index)
+        return keys[start_index:end_index]
+
+    def smallest(self, number: int) -> list:
+        """索引の順序で先頭から指定数の要素のキーのlistを取得する。
+        """
+        return self._get_sorted_index()[3][:max(number, 0)]
+
+    def largest(self, number: int) -> list:
+        """索引の順序で末尾から指定数の要素のキーのlistを、大きい順に取得する。
+        """
+        keys = self._get_sorted_index()[3]
+        if number <= 0:
+            return []
+        return keys[:-number - 1:-1]
+
+    def create_value_index(self):
+        """値から要素のキーを参照する索引を作成する。
+        索引はput、remove_key、remove_value、merge、add、extend、clearによる変更に合わせて更新され、
+        keys_forとremove_valueは配列全体を走査せずに一致する要素を参照できる。ハッシュ化できない値の要素は別に保持され、走査して比較される。
+        """
+        self._value_index = ({}, {})
+        for key, value in self._dict.items():
+            self._add_to_value_index(key, value)
+
+    def drop_value_index(self):
+        """create_value_indexで作成した索引を破棄する。
+        """
+        self._value_index = None
+
+    def _add_to_value_index(self, key: any, value: any):
+        hashable, unhashable = self._value_index
+        try:
+            keys = hashable.get(value)
+        except TypeError:
+            unhashable[key] = None
+            return
+        if keys is None:
+            keys = {}
+            hashable[value] = keys
+        keys[key] = None
+
+    def _remove_from_value_index(self, key: any, value: any):
+        hashable, unhashable = self._value_index
+        try:
+            keys = hashable.get(value)
+        except TypeError:
+            unhashable.pop(key, None)
+            return
+        if keys is not None:
+            keys.pop(key, None)
+            if keys.__len__() == 0:
+                del hashable[value]
+
+    def keys_for(self, value: any) -> list:
+        """指定された値と等しい値を持つ要素のキーのlistを取得する。
+        値の索引がない場合と、指定された値がハッシュ化できない場合は配列全体を走査して比較する。
+        """
+        hashable = None
+        if self._value_index is not None:
+            hashable, unhashable = self._value_index
+            try:
+                keys = list(hashable.get(value, ()))
+            except TypeError:
+                hashable = None
+        if hashable is None:
+            try:
+                return [key for key, one in self._dict.items() if value == one]
+            except TypeError:
+                return []
+        for key in unhashable:
+            if self._dict[key] == value:
+                keys.append(key)
+        return keys
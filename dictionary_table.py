@@ -0,0 +1,140 @@
+import scent_python as scent
+import array
+
+
+class DictionaryTable(scent.Object):
+    """同じキーを持つ多数の連想配列を、キーを一度だけ保持して値を列ごとにまとめて格納するクラス。
+    列はlist、またはtypecodesで型コードを指定した列はarray.arrayで保持される。arrayの列にはその型の値だけを格納できる。
+    各行はDictionaryと同じように参照できるDictionaryTableRowとして取得する。
+    """
+
+    def __init__(self, keys: list | tuple, typecodes: dict = None):
+        if typecodes is None:
+            typecodes = {}
+        self._keys = tuple(dict.fromkeys(keys))
+        self._typecodes = dict(typecodes)
+        self._columns = {}
+        for key in self._keys:
+            typecode = self._typecodes.get(key)
+            if typecode is None:
+                self._columns[key] = []
+            else:
+                self._columns[key] = array.array(typecode)
+        self._length = 0
+
+    @property
+    def typecodes(self) -> dict:
+        return self._typecodes
+
+    def keys(self) -> tuple:
+        """すべてのキーを取得する。
+        """
+        return self._keys
+
+    def __len__(self) -> int:
+        return self._length
+
+    def length(self) -> int:
+        """行数を取得する。
+        """
+        return self._length
+
+    def __iter__(self):
+        row_class = scent.DictionaryTableRow
+        return (row_class(self, index) for index in range(self._length))
+
+    def __getitem__(self, index: int) -> "scent.DictionaryTableRow":
+        return self.row(index)
+
+    def row(self, index: int) -> "scent.DictionaryTableRow":
+        """指定された行を参照するDictionaryTableRowを取得する。
+        """
+        if index < 0:
+            index += self._length
+        if index < 0 or index >= self._length:
+            raise IndexError("DictionaryTable index out of range.")
+        return scent.DictionaryTableRow(self, index)
+
+    def column(self, key: str) -> list | array.array:
+        """指定されたキーの列を複製せずに取得する。キーがない場合はNoneを返す。
+        """
+        return self._columns.get(key)
+
+    def get(self, index: int, key: str) -> any:
+        """指定された行とキーの値を取得する。キーがない場合はNoneを返す。
+        """
+        column = self._columns.get(key)
+        if column is None:
+            return None
+        return column[index]
+
+    def append(self, values: "dict | scent.Dictionary | list | tuple"):
+        """1行を末尾に追加する。連想配列の場合はテーブルにないキーを無視し、値がないキーはNoneになる。
+        listまたはtupleの場合はkeysと同じ順序の値として扱われる。
+        arrayの列はNoneを格納できないため、値がない場合やその型で格納できない値の場合は例外が発生し、行は追加されない。
+        """
+        if isinstance(values, scent.Dictionary):
+            values = values.dict
+        if isinstance(values, dict):
+            get = values.get
+            values = [get(key) for key in self._keys]
+        elif values.__len__() != self._keys.__len__():
+            raise ValueError("Number of values does not match the number of keys.")
+        written = []
+        try:
+            for column, value in zip(self._columns.values(), values):
+                column.append(value)
+                written.append(column)
+        except (TypeError, ValueError, OverflowError):
+            for column in written:
+                column.pop()
+            raise
+        self._length += 1
+
+    def extend(self, rows: any):
+        """複数の行を末尾に追加する。
+        """
+        for values in rows:
+            self.append(values)
+
+    def to_dictionaries(self) -> list:
+        """すべての行をDictionaryに変換したlistを作成する。
+        """
+        keys = self._keys
+        return [scent.Dictionary(dict(zip(keys, values))) for values in zip(*self._columns.values())]
+
+    @staticmethod
+    def from_dictionaries(dictionaries: any, keys: list | tuple = None, typecodes: dict = None) -> "DictionaryTable":
+        """複数の連想配列からテーブルを作成する。keysを省略した場合は最初の連想配列のキーが使用される。
+        """
+        table = None
+        if keys is not None:
+            table = DictionaryTable(keys, typecodes)
+        for dictionary in dictionaries:
+            if isinstance(dictionary, scent.Dictionary):
+                dictionary = dictionary.dict
+            if table is None:
+                table = DictionaryTable(tuple(dictionary.keys()), typecodes)
+            table.append(dictionary)
+        if table is None:
+            table = DictionaryTable((), typecodes)
+        return table
+
+    @staticmethod
+    def from_columns(columns: dict, typecodes: dict = None) -> "DictionaryTable":
+        """キーと列のdictからテーブルを作成する。RecordSchema.to_columnsの結果を変換する場合などに使用する。
+        列の長さが異なる場合や、arrayの列に格納できない値がある場合は例外が発生し、テーブルは作成されない。
+        """
+        table = DictionaryTable(tuple(columns.keys()), typecodes)
+        columns = {key: list(values) for key, values in columns.items()}
+        lengths = {values.__len__() for values in columns.values()}
+        if lengths.__len__() > 1:
+            raise ValueError("Columns have different lengths.")
+        for key, values in columns.items():
+            typecode = table._typecodes.get(key)
+            if typecode is None:
+                table._columns[key] = values
+            else:
+                table._columns[key] = array.array(typecode, values)
+        table._length = lengths.pop() if lengths.__len__() > 0 else 0
+        return table
@@ -0,0 +1,91 @@
+import scent_python as scent
+
+
+class DictionaryTableRow(scent.Object):
+    """DictionaryTableの1行を、値を複製せずにDictionaryと同じ方法で参照するクラス。
+    """
+
+    __slots__ = ("_table", "_index")
+
+    def __init__(self, table: "scent.DictionaryTable", index: int):
+        self._table = table
+        self._index = index
+
+    @property
+    def table(self) -> "scent.DictionaryTable":
+        return self._table
+
+    @property
+    def index(self) -> int:
+        return self._index
+
+    @property
+    def dict(self) -> dict:
+        index = self._index
+        return {key: column[index] for key, column in self._table._columns.items()}
+
+    def __repr__(self) -> str:
+        return repr(self.dict)
+
+    def __str__(self) -> str:
+        return str(self.dict)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, DictionaryTableRow):
+            return self.dict == other.dict
+        if isinstance(other, scent.Dictionary):
+            return self.dict == other.dict
+        return self.dict == other
+
+    def __iter__(self):
+        index = self._index
+        return ((key, column[index]) for key, column in self._table._columns.items())
+
+    def copy(self) -> "scent.Dictionary":
+        """行の値をコピーしたDictionaryを作成する。
+        """
+        return scent.Dictionary(self.dict)
+
+    def length(self) -> int:
+        """要素数を取得する。
+        """
+        return self._table._keys.__len__()
+
+    def values(self) -> tuple:
+        """行内のすべての値を取得する。
+        """
+        index = self._index
+        return tuple(column[index] for column in self._table._columns.values())
+
+    def keys(self) -> tuple:
+        """行内のすべてのキーを取得する。
+        """
+        return self._table._keys
+
+    def get(self, key: str) -> any:
+        """値を取得する。
+        """
+        column = self._table._columns.get(key)
+        if column is None:
+            return None
+        return column[self._index]
+
+    def get_int(self, key: str) -> int:
+        """値をintとして取得する。
+        """
+        return scent.NumberParser.to_int(self.get(key), False)
+
+    def get_float(self, key: str) -> float:
+        """値をfloatとして取得する。
+        """
+        return scent.NumberParser.to_float(self.get(key), False)
+
+    def get_bool(self, key: str) -> bool:
+        """値をboolとして取得する。
+        """
+        return scent.NumberParser.to_bool(self.get(key), False)
+
+    def get_datetime(self, key: str) -> "scent.Datetime":
+        """値をDatetimeとして取得する。
+        """
+        return scent.Datetime(self.get(key))
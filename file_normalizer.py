@@ -0,0 +1,135 @@
+import scent_python as scent
+import re
+
+
+class FileNormalizer(scent.Object):
+    """ファイルを一定の文字数ずつ読み込みながらStringの変換処理を適用して書き出すクラス。
+    変換処理にはNormalizerと同じ形式で変換表による変換、改行とタブの置き換え、trimを指定できる。
+    チャンクの境界をまたぐCRLFや半角カナと濁点のような文字列は次のチャンクに持ち越してから変換される。
+    改行の置き換えで持ち越すのは末尾のCRだけで、trimで末尾の候補になるスペースは連続する同じ文字ごとに文字と個数だけを保持する。
+    """
+
+    def __init__(self, operations: list | tuple, chunk_size: int = 1048576):
+        self._operations = scent.Normalizer(operations).operations
+        for operation in self._operations:
+            if operation[0] not in scent.Normalizer.translator_names and operation[0] not in FileNormalizer.line_break_operations and operation[0] != "trim":
+                raise ValueError("FileNormalizer does not support " + operation[0] + ".")
+        self._chunk_size = chunk_size
+
+    @property
+    def operations(self) -> tuple:
+        return self._operations
+
+    @property
+    def chunk_size(self) -> int:
+        return self._chunk_size
+
+    @chunk_size.setter
+    def chunk_size(self, chunk_size: int):
+        self._chunk_size = chunk_size
+
+    def normalize_chunks(self, chunks):
+        """文字列のチャンクを順番に変換するジェネレーターを作成する。
+        """
+        for operation in self._operations:
+            name = operation[0]
+            arguments = operation[1:]
+            if name == "trim":
+                chunks = FileNormalizer._trim(chunks)
+            elif name in FileNormalizer.line_break_operations:
+                chunks = FileNormalizer._replace_line_break(chunks, name, arguments)
+            else:
+                chunks = FileNormalizer._translate(chunks, name)
+        for chunk in chunks:
+            if chunk.__len__() > 0:
+                yield chunk
+
+    def read_chunks(self, path: str, encoding: str = "utf-8"):
+        """ファイルを一定の文字数ずつ読み込むジェネレーターを作成する。改行コードは変換されない。
+        """
+        with open(path, "r", encoding=encoding, newline="") as file:
+            while True:
+                chunk = file.read(self._chunk_size)
+                if chunk.__len__() == 0:
+                    return
+                yield chunk
+
+    def normalize_file(self, source: str, destination: str, encoding: str = "utf-8"):
+        """ファイルを変換して別のファイルに書き出す。
+        """
+        with open(destination, "w", encoding=encoding, newline="") as file:
+            for chunk in self.normalize_chunks(self.read_chunks(source, encoding)):
+                file.write(chunk)
+
+    @staticmethod
+    def _translate(chunks, name: str):
+        translator = scent.String.translator(scent.Normalizer.translator_names[name])
+        prepare = None
+        if name == "lower":
+            prepare = str.lower
+        if name == "upper":
+            prepare = str.upper
+        carry = ""
+        for chunk in chunks:
+            text = carry + chunk
+            end = text.__len__() - translator.incomplete_suffix_length(text)
+            carry = text[end:]
+            text = text[:end]
+            if prepare is not None:
+                text = prepare(text)
+            yield translator.translate(text)
+        if prepare is not None:
+            carry = prepare(carry)
+        yield translator.translate(carry)
+
+    @staticmethod
+    def _replace_line_break(chunks, name: str, arguments: tuple):
+        carry = ""
+        for chunk in chunks:
+            text = carry + chunk
+            end = text.__len__()
+            if text.endswith("\r"):
+                end -= 1
+            carry = text[end:]
+            yield getattr(scent.String(text[:end]), name)(*arguments).value
+        yield getattr(scent.String(carry), name)(*arguments).value
+
+    @staticmethod
+    def _trim(chunks):
+        started = False
+        spaces = []
+        carry = ""
+        for chunk in chunks:
+            text = carry + chunk
+            if started == False:
+                text = text.lstrip(" 　")
+                if text.__len__() == 0:
+                    continue
+                started = True
+            end = FileNormalizer.trailing_space_pattern.search(text).start()
+            if end > 0:
+                for character, count in spaces:
+                    for start in range(0, count, end):
+                        yield character * min(end, count - start)
+                spaces.clear()
+                yield text[:end]
+            carry = text[end:]
+            if carry.endswith("\n"):
+                tail = carry[:-1]
+                carry = "\n"
+            else:
+                tail = carry
+                carry = ""
+            for match in FileNormalizer.space_run_pattern.finditer(tail):
+                run = match.group()
+                if spaces.__len__() > 0 and spaces[-1][0] == run[0]:
+                    spaces[-1][1] += run.__len__()
+                else:
+                    spaces.append([run[0], run.__len__()])
+        yield carry
+
+    line_break_operations = ("replace_cr", "replace_lf", "replace_crlf", "replace_tab")
+
+    trailing_space_pattern = re.compile("[ 　]*\n?\\Z")
+
+    space_run_pattern = re.compile(" +|　+")
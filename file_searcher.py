@@ -0,0 +1,101 @@
+import scent_python as scent
+import concurrent.futures
+import mmap
+import os
+import re
+
+
+def _search_range(path: str, pattern: re.Pattern, start: int, end: int) -> list:
+    with open(path, "rb") as file:
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            return list(FileSearcher._iter_spans(buffer, pattern, start, end))
+
+
+class FileSearcher(scent.Object):
+    """ファイルをメモリーマップし、Pythonの文字列に変換せずに正規表現に一致する行を検索するクラス。
+    正規表現は指定されたエンコーディングでバイト列の正規表現に変換され、複数行モードで行単位に評価される。
+    改行をまたいで一致した場合は、その行の中だけで一致するかを確認してから結果に含める。
+    マルチバイト文字の文字クラスや、\\dのようなUnicodeの文字種別はバイト列の正規表現では意図どおりに一致しない。
+    """
+
+    def __init__(self, regex: str | bytes | re.Pattern, encoding: str = "utf-8", flags: int = 0):
+        if isinstance(regex, re.Pattern):
+            flags = flags | regex.flags
+            regex = regex.pattern
+        if isinstance(regex, str):
+            regex = regex.encode(encoding)
+        self._encoding = encoding
+        self._pattern = re.compile(regex, (flags & ~re.UNICODE) | re.MULTILINE)
+
+    @property
+    def pattern(self) -> re.Pattern:
+        return self._pattern
+
+    @property
+    def encoding(self) -> str:
+        return self._encoding
+
+    @staticmethod
+    def _iter_spans(buffer: any, pattern: re.Pattern, start: int, end: int):
+        search = pattern.search
+        if end > start and buffer[end - 1:end] == b"\n":
+            end -= 1
+        position = start
+        while position <= end:
+            match = search(buffer, position, end)
+            if match is None:
+                return
+            line_start = buffer.rfind(b"\n", 0, match.start()) + 1
+            line_end = buffer.find(b"\n", match.start())
+            if line_end == -1:
+                line_end = buffer.__len__()
+            if match.end() <= line_end or search(buffer, line_start, line_end) is not None:
+                yield (line_start, line_end)
+            position = line_end + 1
+
+    def iter_spans(self, path: str):
+        """正規表現に一致した行の(開始バイト位置, 改行を含まない終了バイト位置)を返すジェネレーターを作成する。
+        """
+        if os.path.getsize(path) == 0:
+            return
+        with open(path, "rb") as file:
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                yield from FileSearcher._iter_spans(buffer, self._pattern, 0, buffer.__len__())
+
+    def iter_lines(self, path: str):
+        """正規表現に一致した行をStringで返すジェネレーターを作成する。
+        """
+        if os.path.getsize(path) == 0:
+            return
+        with open(path, "rb") as file:
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                for line_start, line_end in FileSearcher._iter_spans(buffer, self._pattern, 0, buffer.__len__()):
+                    yield scent.String.from_bytes(buffer[line_start:line_end], self._encoding)
+
+    def search(self, path: str, workers: int = None) -> list:
+        """正規表現に一致した行の(開始バイト位置, 改行を含まない終了バイト位置)のlistを取得する。
+        workersに2以上を指定すると、ファイルを行の境界で分割して複数のプロセスで検索する。
+        """
+        size = os.path.getsize(path)
+        if workers is None or workers < 2 or size < FileSearcher.minimum_range_size * 2:
+            return list(self.iter_spans(path))
+        ranges = []
+        with open(path, "rb") as file:
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                start = 0
+                for number in range(1, workers):
+                    end = buffer.find(b"\n", max(size * number // workers, start)) + 1
+                    if end <= start:
+                        break
+                    ranges.append((start, end))
+                    start = end
+                if start < size:
+                    ranges.append((start, size))
+        result = []
+        with concurrent.futures.ProcessPoolExecutor(workers) as executor:
+            futures = [executor.submit(_search_range, path, self._pattern, start, end) for start, end in ranges]
+            for future in futures:
+                result.extend(future.result())
+        return result
+
+    minimum_range_size = 1048576
@@ -0,0 +1,114 @@
+import scent_python as scent
+import threading
+import weakref
+
+
+class FrozenString(scent.Object):
+    """変更できない文字列のクラス。ハッシュ値と正規化した文字列を一度だけ計算して保持する。
+    strと等しい値のインスタンスはstrと同じハッシュ値を持つため、辞書のキーや集合の要素として使用できる。
+    """
+
+    __slots__ = ("_value", "_hash", "_normalized", "__weakref__")
+
+    def __init__(self, value: any = ""):
+        if isinstance(value, (FrozenString, scent.String)):
+            value = value.value
+        object.__setattr__(self, "_value", str(value))
+        object.__setattr__(self, "_hash", None)
+        object.__setattr__(self, "_normalized", None)
+
+    def __setattr__(self, name: str, value: any):
+        raise AttributeError("FrozenString is immutable.")
+
+    @property
+    def value(self) -> str:
+        return self._value
+
+    @property
+    def normalized(self) -> str:
+        """normalize_operationsで正規化した文字列。最初に参照されたときに一度だけ計算される。
+        ひらがな、全角カタカナ、半角カタカナの違いと、英字の全角半角と大文字小文字の違いは同じ文字列になる。
+        """
+        if self._normalized is None:
+            object.__setattr__(self, "_normalized", FrozenString._get_normalizer()(self._value))
+        return self._normalized
+
+    def __repr__(self) -> str:
+        return self._value
+
+    def __str__(self) -> str:
+        return self._value
+
+    def __hash__(self) -> int:
+        if self._hash is None:
+            object.__setattr__(self, "_hash", hash(self._value))
+        return self._hash
+
+    def __eq__(self, other: any) -> bool:
+        if isinstance(other, FrozenString):
+            return self is other or (self.__hash__() == other.__hash__() and self._value == other._value)
+        if isinstance(other, (str, scent.String)):
+            return self._value == str(other)
+        return NotImplemented
+
+    def __len__(self) -> int:
+        return self._value.__len__()
+
+    def length(self) -> int:
+        """文字数を取得する。
+        """
+        return self._value.__len__()
+
+    def to_string(self) -> "scent.String":
+        """変更可能なStringを作成する。
+        """
+        return scent.String(self._value)
+
+    def normalized_key(self) -> "FrozenString":
+        """正規化した文字列のインスタンスを取得する。
+        """
+        return FrozenString.intern(self.normalized)
+
+    @staticmethod
+    def _get_normalizer() -> "scent.Normalizer":
+        operations = FrozenString.normalize_operations
+        cached = FrozenString._normalizer
+        if cached is None or cached[0] is not operations:
+            cached = (operations, scent.Normalizer(operations))
+            FrozenString._normalizer = cached
+        return cached[1]
+
+    @staticmethod
+    def intern(value: any) -> "FrozenString":
+        """同じ値のインスタンスが存在する場合はそのインスタンスを取得する。インスタンスはどこからも参照されなくなると破棄される。
+        """
+        if isinstance(value, FrozenString):
+            key = value.value
+        else:
+            key = str(value)
+        with FrozenString._pool_lock:
+            instance = FrozenString._pool.get(key)
+            if instance is None:
+                instance = value if isinstance(value, FrozenString) else FrozenString(key)
+                FrozenString._pool[key] = instance
+            return instance
+
+    @staticmethod
+    def unique(values: any, normalize: bool = False) -> list:
+        """重複を除いたインスタンスのlistを最初に現れた順で作成する。normalizeにTrueを指定すると正規化した文字列で重複を判定する。
+        """
+        result = {}
+        for value in values:
+            instance = value if isinstance(value, FrozenString) else FrozenString(value)
+            key = instance.normalized if normalize else instance
+            if key not in result:
+                result[key] = instance
+        return list(result.values())
+
+    normalize_operations = ("katakana", "wide", "narrow", "lower")
+
+    _normalizer = None
+
+    _pool = weakref.WeakValueDictionary()
+
+    _pool_lock = threading.Lock()
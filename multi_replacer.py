@@ -0,0 +1,108 @@
+import scent_python as scent
+import re
+
+
+class MultiReplacer(scent.Object):
+    """複数の文字列を一度の走査で置き換えるクラス。
+    置き換え表からAho-Corasick法のオートマトンを一度だけ構築し、左端で最長のキーを優先して置き換える。
+    構築後のインスタンスは変更されないため、複数の呼び出しやスレッドで共有できる。
+    """
+
+    def __init__(self, mapping: dict):
+        self._mapping = {}
+        for key, replacement in mapping.items():
+            key = str(key)
+            if key.__len__() > 0:
+                self._mapping[key] = str(replacement)
+        self._transitions = [{}]
+        self._lengths = [0]
+        for key in self._mapping.keys():
+            state = 0
+            for character in key:
+                following = self._transitions[state].get(character)
+                if following is None:
+                    following = self._transitions.__len__()
+                    self._transitions[state][character] = following
+                    self._transitions.append({})
+                    self._lengths.append(0)
+                state = following
+            self._lengths[state] = key.__len__()
+        self._failures = [0] * self._transitions.__len__()
+        self._outputs = [-1] * self._transitions.__len__()
+        queue = list(self._transitions[0].values())
+        for state in queue:
+            for character, following in self._transitions[state].items():
+                failure = self._failures[state]
+                while failure > 0 and character not in self._transitions[failure]:
+                    failure = self._failures[failure]
+                failure = self._transitions[failure].get(character, 0)
+                if failure == following:
+                    failure = 0
+                self._failures[following] = failure
+                if self._lengths[failure] > 0:
+                    self._outputs[following] = failure
+                else:
+                    self._outputs[following] = self._outputs[failure]
+                queue.append(following)
+        self._start_pattern = None
+        if self._transitions[0].__len__() > 0:
+            self._start_pattern = re.compile("[" + "".join(map(re.escape, self._transitions[0].keys())) + "]")
+
+    @property
+    def mapping(self) -> dict:
+        return self._mapping
+
+    def find(self, value: str) -> list:
+        """置き換えの対象になる部分の(開始インデックス, 終了インデックス)のlistを取得する。
+        """
+        if self._start_pattern is None:
+            return []
+        transitions = self._transitions
+        failures = self._failures
+        outputs = self._outputs
+        lengths = self._lengths
+        search = self._start_pattern.search
+        longest_ends = {}
+        state = 0
+        index = 0
+        length = value.__len__()
+        while index < length:
+            if state == 0:
+                match = search(value, index)
+                if match is None:
+                    break
+                index = match.start()
+            character = value[index]
+            index += 1
+            while state > 0 and character not in transitions[state]:
+                state = failures[state]
+            state = transitions[state].get(character, 0)
+            output = state
+            if lengths[output] == 0:
+                output = outputs[output]
+            while output > 0:
+                start = index - lengths[output]
+                if longest_ends.get(start, 0) < index:
+                    longest_ends[start] = index
+                output = outputs[output]
+        spans = []
+        position = 0
+        for start in sorted(longest_ends.keys()):
+            if start >= position:
+                position = longest_ends[start]
+                spans.append((start, position))
+        return spans
+
+    def replace(self, value: str) -> str:
+        """置き換え表のキーに一致する部分を置き換える。
+        """
+        parts = []
+        position = 0
+        for start, end in self.find(value):
+            parts.append(value[position:start])
+            parts.append(self._mapping[value[start:end]])
+            position = end
+        if position == 0:
+            return value
+        parts.append(value[position:])
+        return "".join(parts)
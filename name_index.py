@@ -0,0 +1,128 @@
+import scent_python as scent
+import json
+
+
+class NameIndex(scent.Object):
+    """全角と半角、ひらがなとカタカナの違いを無視して名前を部分一致で検索するための索引のクラス。
+    登録する名前はNormalizerで一度だけ正規化され、1文字からn文字までの部分文字列からキーを引く転置索引に格納される。
+    n文字より短い検索語は索引を一度引くだけで検索できる。
+    """
+
+    def __init__(self, n: int = 2, operations: list | tuple = None):
+        if operations is None:
+            operations = NameIndex.default_operations
+        self._n = n
+        self._normalizer = scent.Normalizer(operations)
+        self._entries = {}
+        self._postings = {}
+
+    @property
+    def n(self) -> int:
+        return self._n
+
+    @property
+    def operations(self) -> tuple:
+        return self._normalizer.operations
+
+    def __len__(self) -> int:
+        return self._entries.__len__()
+
+    def __contains__(self, key: any) -> bool:
+        return key in self._entries
+
+    def length(self) -> int:
+        """登録されている名前の数を取得する。
+        """
+        return self._entries.__len__()
+
+    def normalize(self, name: any) -> str:
+        """名前を索引と同じ方法で正規化する。
+        """
+        return self._normalizer(name)
+
+    def _make_grams(self, normalized: str, shortest: int = 1) -> set:
+        grams = set()
+        for size in range(shortest, self._n + 1):
+            grams.update(normalized[index:index + size] for index in range(normalized.__len__() - size + 1))
+        return grams
+
+    def add(self, key: any, name: any):
+        """名前を登録する。同じキーが登録済みの場合は置き換えられる。
+        """
+        if key in self._entries:
+            self.remove(key)
+        self._index(key, self._normalizer(name))
+
+    def _index(self, key: any, normalized: str):
+        self._entries[key] = normalized
+        for gram in self._make_grams(normalized):
+            keys = self._postings.get(gram)
+            if keys is None:
+                keys = set()
+                self._postings[gram] = keys
+            keys.add(key)
+
+    def remove(self, key: any):
+        """指定されたキーの名前を索引から削除する。
+        """
+        normalized = self._entries.pop(key, None)
+        if normalized is None:
+            return
+        for gram in self._make_grams(normalized):
+            keys = self._postings.get(gram)
+            if keys is not None:
+                keys.discard(key)
+                if keys.__len__() == 0:
+                    del self._postings[gram]
+
+    def get(self, key: any) -> str:
+        """登録されている正規化済みの名前を取得する。
+        """
+        return self._entries.get(key)
+
+    def search(self, query: any, limit: int = None) -> list:
+        """正規化した検索語を含む名前のキーのlistを、正規化済みの名前が短い順に取得する。
+        """
+        normalized = self._normalizer(query)
+        if normalized.__len__() == 0:
+            return []
+        if normalized.__len__() <= self._n:
+            candidates = self._postings.get(normalized, ())
+        else:
+            postings = []
+            for gram in self._make_grams(normalized, self._n):
+                keys = self._postings.get(gram)
+                if keys is None:
+                    return []
+                postings.append(keys)
+            postings.sort(key=len)
+            candidates = set(postings[0])
+            for keys in postings[1:]:
+                candidates.intersection_update(keys)
+                if candidates.__len__() == 0:
+                    return []
+        entries = self._entries
+        result = [key for key in candidates if normalized in entries[key]]
+        result.sort(key=lambda key: entries[key].__len__())
+        if limit is not None:
+            return result[:limit]
+        return result
+
+    def save(self, path: str):
+        """索引をJSON形式でファイルに保存する。キーはJSONで表現できる値である必要がある。
+        """
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump({"n": self._n, "operations": self.operations, "entries": list(self._entries.items())}, file, ensure_ascii=False)
+
+    @staticmethod
+    def load(path: str) -> "NameIndex":
+        """saveで保存したファイルから索引を復元する。
+        """
+        with open(path, "r", encoding="utf-8") as file:
+            data = json.load(file)
+        index = NameIndex(data["n"], [tuple(operation) for operation in data["operations"]])
+        for key, normalized in data["entries"]:
+            index._index(key, normalized)
+        return index
+
+    default_operations = ("wide", "katakana", "upper", ("replace", "[ 　]", ""))
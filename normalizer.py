@@ -0,0 +1,144 @@
+import scent_python as scent
+
+
+class Normalizer(scent.Object):
+    """Stringの変換処理を順番に連結して一度に適用するクラス。
+    変換処理には"narrow"のようなメソッド名、または("replace", regex, replacement)のようなメソッド名と引数の組を指定する。
+    指定できるのはoperation_namesに含まれる、Stringを返す変換のメソッドだけ。
+    連続する変換表による変換は1つの変換器に合成され、再利用するたびに構築し直されることはない。
+    ConversionCacheを指定すると同じ文字列の変換結果を再利用する。
+    """
+
+    def __init__(self, operations: list | tuple, cache: "scent.ConversionCache" = None):
+        self._operations = tuple(Normalizer._parse_operation(operation) for operation in operations)
+        self._steps = Normalizer._compile(self._operations)
+        self._cache = cache
+
+    @property
+    def operations(self) -> tuple:
+        return self._operations
+
+    @property
+    def cache(self) -> "scent.ConversionCache":
+        return self._cache
+
+    @cache.setter
+    def cache(self, cache: "scent.ConversionCache"):
+        self._cache = cache
+
+    def __call__(self, value: any) -> str:
+        if self._cache is None:
+            return self._convert(str(value))
+        return self._cache.convert(self._operations, str(value), self._convert)
+
+    def _convert(self, value: str) -> str:
+        for step in self._steps:
+            value = step(value)
+        return value
+
+    def normalize(self, value: any) -> str:
+        """文字列を変換する。
+        """
+        return self(value)
+
+    def normalize_many(self, values):
+        """複数の文字列を順番に変換するジェネレーターを作成する。
+        """
+        if self._cache is not None:
+            for value in values:
+                yield self._cache.convert(self._operations, str(value), self._convert)
+            return
+        steps = self._steps
+        for value in values:
+            value = str(value)
+            for step in steps:
+                value = step(value)
+            yield value
+
+    @staticmethod
+    def _parse_operation(operation: str | tuple | list) -> tuple:
+        if isinstance(operation, str):
+            operation = (operation,)
+        name = operation[0]
+        if name not in Normalizer.operation_names:
+            raise ValueError("String has no operation named " + str(name) + ".")
+        return tuple(operation)
+
+    @staticmethod
+    def _compile(operations: tuple) -> list:
+        steps = []
+        translator = None
+        for operation in operations:
+            name = operation[0]
+            arguments = operation[1:]
+            if name in Normalizer.translator_names and len(arguments) == 0:
+                if name == "lower" or name == "upper":
+                    if translator is not None:
+                        steps.append(translator.translate)
+                        translator = None
+                    steps.append(str.lower if name == "lower" else str.upper)
+                following = scent.String.translator(Normalizer.translator_names[name])
+                if translator is None:
+                    translator = following
+                elif following.is_composable():
+                    translator = translator.compose(following)
+                else:
+                    steps.append(translator.translate)
+                    translator = following
+                continue
+            if translator is not None:
+                steps.append(translator.translate)
+                translator = None
+            if name == "trim" and len(arguments) == 0:
+                steps.append(Normalizer._trim)
+            else:
+                steps.append(Normalizer._make_string_step(name, arguments))
+        if translator is not None:
+            steps.append(translator.translate)
+        return steps
+
+    @staticmethod
+    def _trim(value: str) -> str:
+        if value.endswith("\n"):
+            return scent.String(value).trim().value
+        return value.strip(" 　")
+
+    @staticmethod
+    def _make_string_step(name: str, arguments: tuple):
+        def step(value: str) -> str:
+            return getattr(scent.String(value), name)(*arguments).value
+        return step
+
+    operation_names = frozenset((
+        "insert",
+        "prepend",
+        "append",
+        "padding_left",
+        "padding_right",
+        "extract",
+        "extract_by_regex",
+        "repeat",
+        "replace",
+        "replace_many",
+        "replace_cr",
+        "replace_lf",
+        "replace_crlf",
+        "replace_tab",
+        "trim",
+        "remove_meaningless_decimal_point",
+        "narrow",
+        "wide",
+        "lower",
+        "upper",
+        "hiragana",
+        "katakana",
+    ))
+
+    translator_names = {
+        "narrow": "wide_to_narrow",
+        "wide": "narrow_to_wide",
+        "lower": "upper_to_lower",
+        "upper": "lower_to_upper",
+        "hiragana": "katakana_to_hiragana",
+        "katakana": "hiragana_to_katakana",
+    }
@@ -0,0 +1,132 @@
+import scent_python as scent
+import array
+import math
+import re
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class NumberParser(scent.Object):
+    """値をString.to_int、to_float、to_boolと同じ寛容な規則でint、float、boolに変換する静的関数のクラス。
+    すでに整った値は正規表現を使わずに変換し、複数の値を一括で変換した場合は失敗したインデックスを返す。
+    narrowにTrueを指定すると全角の数字や記号を半角に変換してから解析する。
+    """
+
+    @staticmethod
+    def to_int(value: any, narrow: bool = True) -> int:
+        """intに変換する。失敗した場合はNoneを返す。
+        """
+        if value.__class__ is int:
+            return value
+        text = str(value)
+        if text.isascii():
+            try:
+                return int(text)
+            except ValueError:
+                pass
+        elif narrow:
+            text = scent.String.translator("wide_to_narrow").translate(text)
+        try:
+            return int(NumberParser.int_removal_pattern.sub("", text))
+        except ValueError:
+            return None
+
+    @staticmethod
+    def to_float(value: any, narrow: bool = True) -> float:
+        """floatに変換する。失敗した場合はNoneを返す。
+        """
+        text = str(value)
+        if text.isascii():
+            if NumberParser.clean_float_pattern.fullmatch(text) is not None:
+                return float(text)
+        elif narrow:
+            text = scent.String.translator("wide_to_narrow").translate(text)
+        try:
+            return float(NumberParser.float_removal_pattern.sub("", text))
+        except ValueError:
+            return None
+
+    @staticmethod
+    def to_bool(value: any, narrow: bool = True) -> bool:
+        """boolに変換する。失敗した場合はNoneを返す。
+        """
+        if value.__class__ is bool:
+            return value
+        text = str(value)
+        if narrow and text.isascii() == False:
+            text = scent.String.translator("wide_to_narrow").translate(text)
+        return NumberParser.bool_values.get(text.lower())
+
+    @staticmethod
+    def parse_int(values: any, narrow: bool = True, use_numpy: bool = False) -> tuple:
+        """複数の値をintに変換し、array('q')と失敗したインデックスのlistのtupleを返す。失敗した要素は0になる。
+        """
+        result = array.array("q")
+        failures = []
+        to_int = NumberParser.to_int
+        for index, value in enumerate(values):
+            number = to_int(value, narrow)
+            if number is not None:
+                try:
+                    result.append(number)
+                    continue
+                except OverflowError:
+                    pass
+            result.append(0)
+            failures.append(index)
+        return (NumberParser._to_numpy(result, use_numpy), failures)
+
+    @staticmethod
+    def parse_float(values: any, narrow: bool = True, use_numpy: bool = False) -> tuple:
+        """複数の値をfloatに変換し、array('d')と失敗したインデックスのlistのtupleを返す。失敗した要素はnanになる。
+        """
+        result = array.array("d")
+        failures = []
+        to_float = NumberParser.to_float
+        for index, value in enumerate(values):
+            number = to_float(value, narrow)
+            if number is None:
+                number = math.nan
+                failures.append(index)
+            result.append(number)
+        return (NumberParser._to_numpy(result, use_numpy), failures)
+
+    @staticmethod
+    def parse_bool(values: any, narrow: bool = True, use_numpy: bool = False) -> tuple:
+        """複数の値をboolに変換し、array('b')と失敗したインデックスのlistのtupleを返す。失敗した要素は0になる。
+        """
+        result = array.array("b")
+        failures = []
+        to_bool = NumberParser.to_bool
+        for index, value in enumerate(values):
+            boolean = to_bool(value, narrow)
+            if boolean is None:
+                boolean = False
+                failures.append(index)
+            result.append(boolean)
+        if use_numpy:
+            return (NumberParser._to_numpy(result, use_numpy).astype(bool), failures)
+        return (result, failures)
+
+    @staticmethod
+    def _to_numpy(result: array.array, use_numpy: bool) -> any:
+        if use_numpy == False:
+            return result
+        if numpy is None:
+            raise ModuleNotFoundError("Requires installation of numpy!")
+        return numpy.frombuffer(result, dtype=result.typecode)
+
+    int_removal_pattern = re.compile("[^0-9\\-]")
+
+    float_removal_pattern = re.compile("[^0-9\\-\\.]")
+
+    clean_float_pattern = re.compile("-?[0-9]+(?:\\.[0-9]*)?")
+
+    bool_values = {
+        "true": True,
+        "1": True,
+        "false": False,
+        "0": False,
+    }
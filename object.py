@@ -4,6 +4,8 @@ class Object(metaclass=abc.ABCMeta):
     """scentライブラリすべてのクラスがこのクラスを継承する。
     """
 
+    __slots__ = ()
+
     def id(self) -> int:
         """オブジェクト固有のIDを取得する。
         """
@@ -0,0 +1,101 @@
+import scent_python as scent
+import collections
+import concurrent.futures
+import itertools
+import math
+import os
+
+
+_worker_normalizer = None
+
+
+def _initialize_worker(operations: tuple):
+    global _worker_normalizer
+    _worker_normalizer = scent.Normalizer(operations)
+
+
+def _normalize_chunk(values: list) -> list:
+    return list(_worker_normalizer.normalize_many(values))
+
+
+class ParallelNormalizer(scent.Object):
+    """Normalizerの変換処理を複数のプロセスで並列に実行するクラス。
+    各プロセスは起動時に一度だけ変換器を構築するため、変換表はタスクごとに転送されない。
+    """
+
+    def __init__(self, operations: list | tuple, workers: int = None, chunk_size: int = None):
+        self._operations = scent.Normalizer(operations).operations
+        self._workers = workers
+        if self._workers is None:
+            self._workers = os.cpu_count() or 1
+        self._chunk_size = chunk_size
+        self._executor = None
+
+    @property
+    def operations(self) -> tuple:
+        return self._operations
+
+    @property
+    def workers(self) -> int:
+        return self._workers
+
+    @property
+    def chunk_size(self) -> int:
+        return self._chunk_size
+
+    @chunk_size.setter
+    def chunk_size(self, chunk_size: int):
+        self._chunk_size = chunk_size
+
+    def __enter__(self) -> "ParallelNormalizer":
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def start(self):
+        """プロセスを起動する。
+        """
+        if self._executor is None:
+            self._executor = concurrent.futures.ProcessPoolExecutor(self._workers, initializer=_initialize_worker, initargs=(self._operations,))
+
+    def close(self):
+        """プロセスを終了する。
+        """
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def _decide_chunk_size(self, values: any) -> int:
+        if self._chunk_size is not None:
+            return self._chunk_size
+        try:
+            length = len(values)
+        except TypeError:
+            return ParallelNormalizer.default_chunk_size
+        return max(ParallelNormalizer.minimum_chunk_size, min(ParallelNormalizer.maximum_chunk_size, math.ceil(length / (self._workers * 4))))
+
+    def normalize_many(self, values):
+        """複数の文字列を並列に変換し、入力と同じ順番で結果を返すジェネレーターを作成する。
+        同時に処理中となるチャンクはプロセス数の2倍までに制限される。
+        """
+        self.start()
+        chunk_size = self._decide_chunk_size(values)
+        iterator = iter(values)
+        futures = collections.deque()
+        while True:
+            while futures.__len__() < self._workers * 2:
+                chunk = [str(value) for value in itertools.islice(iterator, chunk_size)]
+                if chunk.__len__() == 0:
+                    break
+                futures.append(self._executor.submit(_normalize_chunk, chunk))
+            if futures.__len__() == 0:
+                return
+            yield from futures.popleft().result()
+
+    default_chunk_size = 2048
+
+    minimum_chunk_size = 64
+
+    maximum_chunk_size = 20000
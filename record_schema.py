@@ -0,0 +1,153 @@
+import scent_python as scent
+import collections
+import datetime
+import functools
+import re
+
+
+class RecordSchema(scent.Object):
+    """項目名と型の対応を一度だけ解析し、複数の連想配列を型変換した列またはレコードのtupleに一括で変換するクラス。
+    型には"str"、"int"、"float"、"bool"、"datetime"の名前、str、int、float、bool、datetime.datetime、scent.Datetimeの型、
+    または値を引数に変換結果を返す関数を指定できる。変換に失敗した値はNoneになり、失敗したインデックスが項目ごとに記録される。
+    日時の文字列はDatetime.from_strと同じ規則で解析され、同じ文字列の解析結果は再利用される。
+    """
+
+    def __init__(self, fields: dict):
+        self._fields = tuple(fields.keys())
+        self._converters = tuple(RecordSchema._compile(field_type) for field_type in fields.values())
+        self._record_class = collections.namedtuple("Record", self._fields, rename=True)
+
+    @property
+    def fields(self) -> tuple:
+        return self._fields
+
+    @property
+    def record_class(self) -> type:
+        return self._record_class
+
+    @staticmethod
+    def _compile(field_type: any):
+        number_parser = scent.NumberParser
+        if field_type in ("str", str):
+            return str
+        if field_type in ("int", int):
+            to_int = number_parser.to_int
+            return lambda value: to_int(value, False)
+        if field_type in ("float", float):
+            to_float = number_parser.to_float
+            return lambda value: to_float(value, False)
+        if field_type in ("bool", bool):
+            to_bool = number_parser.to_bool
+            return lambda value: to_bool(value, False)
+        if field_type in ("datetime", scent.Datetime):
+            return RecordSchema._to_datetime
+        if field_type is datetime.datetime:
+            return RecordSchema._to_python_datetime
+        if callable(field_type) == False:
+            raise ValueError("Unsupported field type: " + repr(field_type))
+        def convert(value: any) -> any:
+            try:
+                return field_type(value)
+            except (TypeError, ValueError):
+                return None
+        return convert
+
+    @staticmethod
+    def _to_datetime(value: any) -> "scent.Datetime":
+        if isinstance(value, datetime.datetime):
+            return scent.Datetime(value)
+        if isinstance(value, scent.Datetime):
+            return value
+        parsed = RecordSchema._parse_datetime(str(value))
+        if parsed is None:
+            return None
+        return scent.Datetime(parsed[0], parsed[1])
+
+    @staticmethod
+    @functools.lru_cache(maxsize=65536)
+    def _parse_datetime(value: str) -> tuple:
+        for regex, format in scent.Datetime.regex_and_formats:
+            if regex.match(value) is not None:
+                names = RecordSchema._datetime_fields(format)
+                try:
+                    if names is None:
+                        return (datetime.datetime.strptime(value, format), format)
+                    parameters = {"year": 1900, "month": 1, "day": 1}
+                    parameters.update(zip(names, map(int, RecordSchema.digits_pattern.findall(value))))
+                    return (datetime.datetime(**parameters), format)
+                except ValueError:
+                    return None
+        return None
+
+    @staticmethod
+    @functools.lru_cache(maxsize=64)
+    def _datetime_fields(format: str) -> tuple:
+        directives = RecordSchema.directive_pattern.findall(format)
+        if RecordSchema.directive_pattern.sub("", format).__contains__("%"):
+            return None
+        names = tuple(RecordSchema.directive_names.get(directive) for directive in directives)
+        if None in names:
+            return None
+        return names
+
+    @staticmethod
+    def _to_python_datetime(value: any) -> datetime.datetime:
+        result = RecordSchema._to_datetime(value)
+        if result is None:
+            return None
+        return result.value
+
+    def convert(self, dictionary: "scent.Dictionary | dict") -> tuple:
+        """1件の連想配列をレコードのtupleに変換する。値がない項目と変換に失敗した項目はNoneになる。
+        """
+        if isinstance(dictionary, scent.Dictionary):
+            dictionary = dictionary.dict
+        get = dictionary.get
+        values = []
+        for field, converter in zip(self._fields, self._converters):
+            value = get(field)
+            if value is not None:
+                value = converter(value)
+            values.append(value)
+        return self._record_class._make(values)
+
+    def to_columns(self, dictionaries: any) -> tuple:
+        """複数の連想配列を項目ごとのlistに変換し、項目名をキーにした列のdictと、項目名をキーにした失敗したインデックスのlistのdictのtupleを返す。
+        値がない項目は失敗として記録されずにNoneになる。
+        """
+        columns = {field: [] for field in self._fields}
+        failures = {field: [] for field in self._fields}
+        plan = tuple((field, converter, columns[field].append, failures[field].append) for field, converter in zip(self._fields, self._converters))
+        dictionary_class = scent.Dictionary
+        for index, dictionary in enumerate(dictionaries):
+            if isinstance(dictionary, dictionary_class):
+                dictionary = dictionary.dict
+            get = dictionary.get
+            for field, converter, append, fail in plan:
+                value = get(field)
+                if value is not None:
+                    value = converter(value)
+                    if value is None:
+                        fail(index)
+                append(value)
+        return (columns, failures)
+
+    def to_records(self, dictionaries: any) -> tuple:
+        """複数の連想配列をレコードのtupleに変換し、レコードのlistと、項目名をキーにした失敗したインデックスのlistのdictのtupleを返す。
+        """
+        columns, failures = self.to_columns(dictionaries)
+        make = self._record_class._make
+        return ([make(values) for values in zip(*columns.values())], failures)
+
+    digits_pattern = re.compile("[0-9]+")
+
+    directive_pattern = re.compile("%([A-Za-z])")
+
+    directive_names = {
+        "Y": "year",
+        "m": "month",
+        "d": "day",
+        "H": "hour",
+        "M": "minute",
+        "S": "second",
+    }
@@ -0,0 +1,84 @@
+import scent_python as scent
+import collections
+import re
+import threading
+import time
+
+
+class RegexCache(scent.Object):
+    """コンパイル済みの正規表現を保持するクラス。保持数を超えた場合は最も長く使われていない正規表現から破棄される。
+    """
+
+    def __init__(self, size: int = 1024):
+        self._size = size
+        self._patterns = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._compile_seconds = 0.0
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    @size.setter
+    def size(self, size: int):
+        with self._lock:
+            self._size = size
+            self._evict()
+
+    def length(self) -> int:
+        """保持している正規表現の数を取得する。
+        """
+        return self._patterns.__len__()
+
+    def compile(self, regex: str | re.Pattern, flags: int = 0) -> re.Pattern:
+        """コンパイル済みの正規表現を取得する。保持していない場合はコンパイルして保持する。
+        """
+        if isinstance(regex, re.Pattern):
+            if flags == 0 or regex.flags & flags == flags:
+                return regex
+            flags = flags | regex.flags
+            regex = regex.pattern
+        key = (type(regex), regex, flags)
+        with self._lock:
+            pattern = self._patterns.get(key)
+            if pattern is not None:
+                self._patterns.move_to_end(key)
+                self._hits += 1
+                return pattern
+        start = time.perf_counter()
+        pattern = re.compile(regex, flags)
+        seconds = time.perf_counter() - start
+        with self._lock:
+            self._misses += 1
+            self._compile_seconds += seconds
+            self._patterns[key] = pattern
+            self._patterns.move_to_end(key)
+            self._evict()
+        return pattern
+
+    def _evict(self):
+        while self._patterns.__len__() > max(self._size, 0):
+            self._patterns.popitem(last=False)
+
+    def statistics(self) -> dict:
+        """ヒット数、ミス数、コンパイルに要した秒数、保持数を取得する。
+        """
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "compile_seconds": self._compile_seconds,
+                "length": self._patterns.__len__(),
+                "size": self._size,
+            }
+
+    def clear(self):
+        """保持しているすべての正規表現と統計を破棄する。
+        """
+        with self._lock:
+            self._patterns.clear()
+            self._hits = 0
+            self._misses = 0
+            self._compile_seconds = 0.0
@@ -1,23 +1,40 @@
 import scent_python as scent
+import functools
+import math
 import sys
 import re
 
 
 class String(scent.Object):
     """文字列のクラス。
+    先頭と末尾への文字列の追加は連結せずに保持され、valueが参照されたときに一度だけ連結される。
     """
 
     def __init__(self, value=""):
         self._value = str(value)
+        self._prefixes = []
+        self._suffixes = []
+        self._length = self._value.__len__()
         self._iterate_index = -1
 
     @property
     def value(self) -> str:
+        if self._prefixes.__len__() > 0 or self._suffixes.__len__() > 0:
+            parts = self._prefixes
+            parts.reverse()
+            parts.append(self._value)
+            parts.extend(self._suffixes)
+            self._value = "".join(parts)
+            self._prefixes = []
+            self._suffixes = []
         return self._value
 
     @value.setter
     def value(self, value):
         self._value = str(value)
+        self._prefixes = []
+        self._suffixes = []
+        self._length = self._value.__len__()
 
     def __add__(self, other):
         return self.append(other)
@@ -38,42 +55,68 @@ class String(scent.Object):
         return self._iterate_index
 
     def __iter__(self):
-        return self
+        return map(String, self.value)
 
     def __next__(self) -> "String":
         if self.length() - 1 <= self.iterate_index:
             self._iterate_index = -1
             raise StopIteration()
         self._iterate_index += 1
-        return self.copy().extract(self.iterate_index, self.iterate_index + 1)
+        return String(self.value[self.iterate_index])
 
     def copy(self) -> "String":
         """インスタンスのコピーを作成する。
         """
         return String(self.value)
 
+    def freeze(self) -> "scent.FrozenString":
+        """現在の値から変更できないFrozenStringを作成する。
+        """
+        return scent.FrozenString(self.value)
+
+    def iter_chars(self):
+        """1文字ずつのstrを返すイテレーターを作成する。
+        """
+        return iter(self.value)
+
+    def iter_graphemes(self):
+        """結合文字、濁点、異体字セレクター、ZWJで連結された文字を1文字として扱い、strを返すイテレーターを作成する。
+        """
+        return map(re.Match.group, String.grapheme_pattern.finditer(self.value))
+
+    def window(self, start: int = 0, end: int = sys.maxsize) -> "scent.StringView":
+        """開始インデックスから終了インデックスまでを複製せずに参照するStringViewを作成する。
+        """
+        return scent.StringView(self.value, start, end)
+
     def length(self) -> int:
         """文字数を取得する。
         """
-        return self.value.__len__()
+        return self._length
 
-    def match(self, regex: str) -> bool:
+    def match(self, regex: str | re.Pattern) -> bool:
         """正規表現に一致する場合はTrueを返す。
         """
-        return re.match(regex, self.value) != None
+        return String.regex_cache.compile(regex).match(self.value) != None
 
     def insert(self, addition: any, index: int) -> "String":
         """文字列を指定インデックスに挿入する。
         """
         if addition == None:
             return
+        addition = str(addition)
         length = self.length()
         position = index
         if position < 0:
-            position = length + index
-        if position > length:
-            position = length
-        self.value = self.value[:index] + str(addition) + self.value[index:]
+            position = max(length + index, 0)
+        if position >= length:
+            self._suffixes.append(addition)
+        elif position == 0:
+            self._prefixes.append(addition)
+        else:
+            value = self.value
+            self._value = value[:position] + addition + value[position:]
+        self._length += addition.__len__()
         return self
 
     def prepend(self, addition: any) -> "String":
@@ -89,15 +132,23 @@ class String(scent.Object):
     def padding_left(self, addition: any, length: int) -> "String":
         """指定文字数になるまで左側に文字列を追加する。
         """
-        while self.length() < length:
-            self.prepend(addition)
+        if addition == None:
+            return self
+        addition = str(addition)
+        shortage = length - self.length()
+        if shortage > 0 and addition.__len__() > 0:
+            self.prepend(addition * math.ceil(shortage / addition.__len__()))
         return self
     
     def padding_right(self, addition: any, length: int) -> "String":
         """指定文字数になるまで右側に文字列を追加する。
         """
-        while self.length() < length:
-            self.append(addition)
+        if addition == None:
+            return self
+        addition = str(addition)
+        shortage = length - self.length()
+        if shortage > 0 and addition.__len__() > 0:
+            self.append(addition * math.ceil(shortage / addition.__len__()))
         return self
     
     def extract(self, startIndex: int = 0, endIndex: int = sys.maxsize) -> "String":
@@ -117,39 +168,47 @@ class String(scent.Object):
         self.value = self.value[start: end]
         return self
 
-    def extract_by_regex(self, regex: str) -> "String":
+    def extract_by_regex(self, regex: str | re.Pattern) -> "String":
         """正規表現に一致した部分を抽出する。
         """
-        value = ""
-        for one in re.findall(regex, self.value):
-            value += one
-        self.value = value
+        self.value = "".join(String.regex_cache.compile(regex).findall(self.value))
         return self
 
     def repeat(self, number: int) -> "String":
         """インスタンスの文字列を指定回数繰り返す。
         """
-        value = ""
-        for i in range(number):
-            value += self.value
-        self.value = value
+        self.value = self.value * number
         return self
 
-    def replace(self, regex: str, replacement: str) -> "String":
+    def replace(self, regex: str | re.Pattern, replacement: str) -> "String":
         """正規表現に一致した部分を置き換える。
         """
-        self.value = re.sub(regex, replacement, self.value)
+        self.value = String.regex_cache.compile(regex).sub(replacement, self.value)
         return self
 
+    def replace_many(self, mapping: "dict | scent.MultiReplacer") -> "String":
+        """置き換え表のキーに一致する部分を一度の走査で置き換える。複数のキーが一致する場合は左端で最長のキーが優先される。
+        dictを指定した場合は呼び出しのたびに置き換え表の全体を文字列に変換して照合するため、同じ置き換え表を繰り返し使用する場合はMultiReplacerを一度だけ作成して指定する。
+        """
+        if isinstance(mapping, dict):
+            mapping = String._multi_replacer(tuple((str(key), str(replacement)) for key, replacement in mapping.items()))
+        self.value = mapping.replace(self.value)
+        return self
+
+    @staticmethod
+    @functools.lru_cache(maxsize=128)
+    def _multi_replacer(items: tuple) -> "scent.MultiReplacer":
+        return scent.MultiReplacer(dict(items))
+
     def replace_cr(self, replacement: str) -> "String":
         """CRを置き換える。CRLFのCRは置き換えない。
         """
-        return self.replace("\r([^\n])|\r$", replacement + "\\1")
+        return self.replace("\r(?!\n)", replacement)
 
     def replace_lf(self, replacement: str) -> "String":
         """LFを置き換える。CRLFのLFは置き換えない。
         """
-        return self.replace("^\n|([^\r])\n", "\\1" + replacement)
+        return self.replace("(?<!\r)\n", replacement)
 
     def replace_crlf(self, replacement: str) -> "String":
         """CRLFを置き換える。
@@ -172,77 +231,44 @@ class String(scent.Object):
         """
         return self.replace("\.{1}0{1,}$", "")
 
+    def _convert(self, operation: str, function) -> "String":
+        if String.conversion_cache is None:
+            self.value = function(self.value)
+        else:
+            self.value = String.conversion_cache.convert(((operation,),), self.value, function)
+        return self
+
     def narrow(self) -> "String":
         """半角に変換する。
         """
-        value = ""
-        for one in self.value:
-            if one in String.wide_to_narrow_dict.keys():
-                value += String.wide_to_narrow_dict[one]
-            else:
-                value += one
-        self.value = value
-        return self
+        return self._convert("narrow", String.translator("wide_to_narrow").translate)
 
     def wide(self) -> "String":
         """全角に変換する。
         """
-        value = ""
-        for one in self.value:
-            if one in String.narrow_to_wide_dict.keys():
-                value += String.narrow_to_wide_dict[one]
-            else:
-                value += one
-        self.value = value
-        return self
+        return self._convert("wide", String.translator("narrow_to_wide").translate)
 
     def lower(self) -> "String":
         """小文字に変換する。
         """
-        value = ""
-        for one in self.value.lower():
-            if one in String.upper_to_lower_dict.keys():
-                value += String.upper_to_lower_dict[one]
-            else:
-                value += one
-        self.value = value
-        return self
+        translator = String.translator("upper_to_lower")
+        return self._convert("lower", lambda value: translator.translate(value.lower()))
 
     def upper(self) -> "String":
         """大文字に変換する。
         """
-        value = ""
-        for one in self.value.upper():
-            if one in String.lower_to_upper_dict.keys():
-                value += String.lower_to_upper_dict[one]
-            else:
-                value += one
-        self.value = value
-        return self
+        translator = String.translator("lower_to_upper")
+        return self._convert("upper", lambda value: translator.translate(value.upper()))
 
     def hiragana(self) -> "String":
         """カタカナをひらがなに変換する。
         """
-        value = ""
-        for one in self.value:
-            if one in String.katakana_to_hiragana_dict.keys():
-                value += String.katakana_to_hiragana_dict[one]
-            else:
-                value += one
-        self.value = value
-        return self
+        return self._convert("hiragana", String.translator("katakana_to_hiragana").translate)
 
     def katakana(self) -> "String":
         """ひらがなをカタカナに変換する。
         """
-        value = ""
-        for one in self.value:
-            if one in String.hiragana_to_katakana_dict.keys():
-                value += String.hiragana_to_katakana_dict[one]
-            else:
-                value += one
-        self.value = value
-        return self
+        return self._convert("katakana", String.translator("hiragana_to_katakana").translate)
 
     def to_bytes(self, encoding: str = "utf-8") -> bytes:
         """bytesに変換する。
@@ -255,6 +281,18 @@ class String(scent.Object):
         """
         return String(bytes.decode(encoding, "ignore"))
 
+    @staticmethod
+    def iter_from_bytes(buffer: any, encoding: str = "utf-8", chunk_size: int = 1048576):
+        """バイト列を一定のバイト数ずつ変換したインスタンスを返すジェネレーターを作成する。マルチバイト文字は分断されない。
+        エンコーディングにNoneを指定すると先頭のバイト列から推定する。
+        """
+        return scent.StringDecoder(encoding).iter_decode(buffer, chunk_size)
+
+    def encode_into(self, buffer: any, offset: int = 0, encoding: str = "utf-8") -> int:
+        """bytesに変換してbufferのoffsetの位置から書き込み、書き込んだバイト数を返す。
+        """
+        return scent.StringEncoder(encoding).encode_into(self.value, buffer, offset, True)
+
     def to_int(self) -> int:
         """intに変換する。失敗した場合はNoneを返す。
         """
@@ -286,18 +324,58 @@ class String(scent.Object):
         """
         return scent.Datetime.from_str(self.value)
 
-    def split(self, regex: str) -> list:
+    def split(self, regex: str | re.Pattern) -> list:
         """正規表現で分割したlistを作成する。
         """
-        return re.split(regex, self.value)
+        return String.regex_cache.compile(regex).split(self.value)
+
+    def iter_split(self, regex: str | re.Pattern, max_split: int = 0):
+        """正規表現で分割した部分を先頭から順番にStringViewで返すジェネレーターを作成する。
+        splitと異なり、正規表現のグループに一致した部分は返されない。
+        """
+        value = self.value
+        position = 0
+        number = 0
+        for match in String.regex_cache.compile(regex).finditer(value):
+            if max_split > 0 and number >= max_split:
+                break
+            yield scent.StringView(value, position, match.start())
+            position = match.end()
+            number += 1
+        yield scent.StringView(value, position)
+
+    def iter_matches(self, regex: str | re.Pattern):
+        """正規表現に一致した部分を先頭から順番にStringViewで返すジェネレーターを作成する。
+        """
+        value = self.value
+        for match in String.regex_cache.compile(regex).finditer(value):
+            yield scent.StringView(value, match.start(), match.end())
 
     def sum(self) -> int:
         """この文字列中の整数1桁を抽出して加算し和を求める。
         """
-        result = 0
-        for one in self.extract_by_regex("[1-9]").value:
-            result += String(one).to_int()
-        return result
+        return scent.CheckDigit.digit_sum(self.value)
+
+    @staticmethod
+    def translator(name: str) -> "scent.Translator":
+        """クラス変数の変換表(name + "_dict")から変換器を取得する。変換器は変換表ごとに一度だけ構築される。
+        """
+        table = getattr(String, name + "_dict")
+        cache = String._translators.get(name)
+        if cache is None or cache[0] is not table:
+            cache = (table, scent.Translator(table))
+            String._translators[name] = cache
+        return cache[1]
+
+    _translators = {}
+
+    regex_cache = scent.RegexCache()
+
+    conversion_cache = None
+
+    combining_characters = "[\u0300-\u036F\u1AB0-\u1AFF\u1DC0-\u1DFF\u20D0-\u20FF\uFE20-\uFE2F\u3099\u309A\uFF9E\uFF9F\uFE00-\uFE0F\U000E0100-\U000E01EF\U0001F3FB-\U0001F3FF]"
+
+    grapheme_pattern = re.compile("\r\n|[\U0001F1E6-\U0001F1FF]{2}|." + combining_characters + "*(?:\u200D." + combining_characters + "*)*", re.DOTALL)
 
     @staticmethod
     def join(objects: tuple | list, separator: str = "") -> "String":
@@ -0,0 +1,192 @@
+import scent_python as scent
+import re
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class StringArray(scent.Object):
+    """複数の文字列に対してStringと同じ処理を一括で行うクラス。
+    文字単位の変換はすべての値を区切り文字で連結した1つの文字列に対して一度だけ実行される。
+    判定の結果はNumPyがインストールされている場合はnumpy.ndarray、されていない場合はlistで返される。
+    """
+
+    def __init__(self, values: any = ()):
+        self._values = [str(value) for value in values]
+
+    @property
+    def values(self) -> list:
+        return self._values
+
+    @values.setter
+    def values(self, values: any):
+        self._values = [str(value) for value in values]
+
+    def __repr__(self) -> str:
+        return repr(self._values)
+
+    def __str__(self) -> str:
+        return str(self._values)
+
+    def __eq__(self, other: any) -> bool:
+        if isinstance(other, StringArray):
+            return self._values == other.values
+        return self._values == list(other)
+
+    def __len__(self) -> int:
+        return self._values.__len__()
+
+    def __iter__(self):
+        return iter(self._values)
+
+    def __getitem__(self, index: int | slice) -> "str | StringArray":
+        if isinstance(index, slice):
+            return StringArray(self._values[index])
+        return self._values[index]
+
+    def copy(self) -> "StringArray":
+        """インスタンスのコピーを作成する。
+        """
+        return StringArray(self._values)
+
+    def length(self) -> int:
+        """要素数を取得する。
+        """
+        return self._values.__len__()
+
+    def filter(self, mask: any) -> "StringArray":
+        """マスクがTrueの要素だけを抽出したインスタンスを作成する。
+        """
+        return StringArray(value for value, selected in zip(self._values, mask) if selected)
+
+    def _apply_to_joined(self, function, function_for_each=None) -> list:
+        if self._values.__len__() == 0:
+            return []
+        joined = StringArray.separator.join(self._values)
+        if joined.count(StringArray.separator) != self._values.__len__() - 1:
+            if function_for_each is None:
+                function_for_each = function
+            return [function_for_each(value) for value in self._values]
+        return function(joined).split(StringArray.separator)
+
+    @staticmethod
+    def _make_mask(values: list) -> any:
+        if numpy is None:
+            return values
+        return numpy.array(values, dtype=bool)
+
+    def normalize(self, operations: list | tuple) -> "StringArray":
+        """Normalizerで指定した変換処理を順番に適用する。
+        """
+        self._values = list(scent.Normalizer(operations).normalize_many(self._values))
+        return self
+
+    def narrow(self) -> "StringArray":
+        """半角に変換する。
+        """
+        self._values = self._apply_to_joined(scent.String.translator("wide_to_narrow").translate)
+        return self
+
+    def wide(self) -> "StringArray":
+        """全角に変換する。
+        """
+        self._values = self._apply_to_joined(scent.String.translator("narrow_to_wide").translate)
+        return self
+
+    def lower(self) -> "StringArray":
+        """小文字に変換する。
+        """
+        translator = scent.String.translator("upper_to_lower")
+        self._values = self._apply_to_joined(lambda value: translator.translate(value.lower()))
+        return self
+
+    def upper(self) -> "StringArray":
+        """大文字に変換する。
+        """
+        translator = scent.String.translator("lower_to_upper")
+        self._values = self._apply_to_joined(lambda value: translator.translate(value.upper()))
+        return self
+
+    def hiragana(self) -> "StringArray":
+        """カタカナをひらがなに変換する。
+        """
+        self._values = self._apply_to_joined(scent.String.translator("katakana_to_hiragana").translate)
+        return self
+
+    def katakana(self) -> "StringArray":
+        """ひらがなをカタカナに変換する。
+        """
+        self._values = self._apply_to_joined(scent.String.translator("hiragana_to_katakana").translate)
+        return self
+
+    def trim(self) -> "StringArray":
+        """先頭と末尾のスペース('U+0020'|'U+3000')を削除する。
+        """
+        return self.normalize(("trim",))
+
+    def replace(self, regex: str | re.Pattern, replacement: str) -> "StringArray":
+        """正規表現に一致した部分を置き換える。
+        """
+        pattern = scent.String.regex_cache.compile(regex)
+        self._values = [pattern.sub(replacement, value) for value in self._values]
+        return self
+
+    def match(self, regex: str | re.Pattern) -> any:
+        """正規表現に一致するかどうかのマスクを作成する。
+        """
+        match = scent.String.regex_cache.compile(regex).match
+        return StringArray._make_mask([match(value) is not None for value in self._values])
+
+    def to_int(self) -> list:
+        """intのlistに変換する。失敗した要素はNoneになる。
+        """
+        pattern = scent.String.regex_cache.compile("[^0-9\\-" + StringArray.separator + "]")
+        pattern_for_each = scent.String.regex_cache.compile("[^0-9\\-]")
+        result = []
+        for value in self._apply_to_joined(lambda value: pattern.sub("", value), lambda value: pattern_for_each.sub("", value)):
+            try:
+                result.append(int(value))
+            except ValueError:
+                result.append(None)
+        return result
+
+    def to_float(self) -> list:
+        """floatのlistに変換する。失敗した要素はNoneになる。
+        """
+        pattern = scent.String.regex_cache.compile("[^0-9\\-\\." + StringArray.separator + "]")
+        pattern_for_each = scent.String.regex_cache.compile("[^0-9\\-\\.]")
+        result = []
+        for value in self._apply_to_joined(lambda value: pattern.sub("", value), lambda value: pattern_for_each.sub("", value)):
+            try:
+                result.append(float(value))
+            except ValueError:
+                result.append(None)
+        return result
+
+    def to_bool(self) -> list:
+        """boolのlistに変換する。失敗した要素はNoneになる。
+        """
+        translator = scent.String.translator("upper_to_lower")
+        values = self._apply_to_joined(lambda value: translator.translate(value.lower()))
+        return [StringArray.bool_values.get(value) for value in values]
+
+    def to_datetime(self) -> list:
+        """Datetimeのlistに変換する。失敗した要素はNoneになる。
+        """
+        return [scent.Datetime.from_str(value) for value in self._values]
+
+    def split(self, regex: str | re.Pattern) -> list:
+        """正規表現で分割したlistのlistを作成する。
+        """
+        split = scent.String.regex_cache.compile(regex).split
+        return [split(value) for value in self._values]
+
+    separator = "\x00"
+
+    bool_values = {
+        "true": True,
+        "1": True,
+        "false": False,
+        "0": False,
+    }
@@ -0,0 +1,139 @@
+import scent_python as scent
+import codecs
+import re
+
+
+class StringDecoder(scent.Object):
+    """分割されたバイト列を順番に受け取り、マルチバイト文字を分断せずにStringへ変換するクラス。
+    bytes、bytearray、memoryview、mmapを複製せずに受け取ることができる。
+    エンコーディングにNoneを指定すると、ASCII以外のバイトを受け取ったあと、UTF-8とcp932のどちらかで変換できないことが分かった時点で推定する。
+    どちらでも変換できるバイト列はsample_sizeに達するか最後のバイト列を受け取るまで持ち越され、その時点でUTF-8と判定される。
+    ASCIIだけのバイト列はどのエンコーディングでも同じ文字になるため、推定するまではそのまま変換される。
+    推定したエンコーディングでは変換できないバイト列を受け取った場合はUnicodeDecodeErrorが発生する。
+    """
+
+    def __init__(self, encoding: str = "utf-8", errors: str = "ignore"):
+        self._encoding = encoding
+        self._errors = errors
+        self._decoder = None
+        self._pending = b""
+        self._started = False
+        self._candidates = None
+        self._undecided = None
+        if encoding is not None:
+            self._decoder = codecs.getincrementaldecoder(encoding)(errors)
+
+    @property
+    def encoding(self) -> str:
+        return self._encoding
+
+    def decode(self, buffer: any, final: bool = False) -> "scent.String":
+        """バイト列を変換する。末尾の不完全な文字は次の呼び出しに持ち越される。
+        """
+        if self._decoder is not None:
+            return scent.String(self._decoder.decode(buffer, final))
+        if self._candidates is not None:
+            return scent.String(self._sniff_candidates(bytes(buffer), final))
+        data = self._pending + bytes(buffer)
+        self._pending = b""
+        match = StringDecoder.non_ascii_pattern.search(data)
+        if match is None:
+            if data.__len__() > 0:
+                self._started = True
+            return scent.String(data.decode("ascii"))
+        index = match.start()
+        if index == 0 and self._started == False and final == False:
+            for bom, encoding in StringDecoder.boms:
+                if data.__len__() < bom.__len__() and bom.startswith(data):
+                    self._pending = data
+                    return scent.String()
+        text = data[:index].decode("ascii")
+        if index == 0 and self._started == False:
+            for bom, encoding in StringDecoder.boms:
+                if data.startswith(bom):
+                    self._started = True
+                    self._encoding = encoding
+                    self._decoder = codecs.getincrementaldecoder(encoding)("strict")
+                    return scent.String(self._decoder.decode(data, final))
+        self._started = True
+        self._candidates = [(encoding, codecs.getincrementaldecoder(encoding)("strict")) for encoding in StringDecoder.candidate_encodings]
+        self._undecided = bytearray()
+        return scent.String(text + self._sniff_candidates(data[index:], final))
+
+    def _sniff_candidates(self, data: bytes, final: bool) -> str:
+        remaining = []
+        for encoding, decoder in self._candidates:
+            try:
+                decoder.decode(data, final)
+                remaining.append((encoding, decoder))
+            except UnicodeDecodeError:
+                pass
+        self._undecided += data
+        if remaining.__len__() > 1 and final == False and self._undecided.__len__() < StringDecoder.sample_size:
+            self._candidates = remaining
+            return ""
+        if remaining.__len__() == 0:
+            self._encoding = StringDecoder.candidate_encodings[-1]
+        else:
+            self._encoding = remaining[0][0]
+        undecided = bytes(self._undecided)
+        self._candidates = None
+        self._undecided = None
+        self._decoder = codecs.getincrementaldecoder(self._encoding)("strict")
+        return self._decoder.decode(undecided, final)
+
+    def reset(self):
+        """持ち越している不完全な文字を破棄する。
+        """
+        self._pending = b""
+        if self._candidates is not None:
+            self._candidates = [(encoding, codecs.getincrementaldecoder(encoding)("strict")) for encoding in StringDecoder.candidate_encodings]
+            self._undecided = bytearray()
+        if self._decoder is not None:
+            self._decoder.reset()
+
+    def iter_decode(self, buffer: any, chunk_size: int = 1048576):
+        """バイト列を一定のバイト数ずつ変換したStringを返すジェネレーターを作成する。
+        """
+        view = memoryview(buffer)
+        try:
+            for start in range(0, view.nbytes, chunk_size):
+                chunk = self.decode(view[start:start + chunk_size])
+                if chunk.length() > 0:
+                    yield chunk
+            chunk = self.decode(b"", True)
+            if chunk.length() > 0:
+                yield chunk
+        finally:
+            view.release()
+
+    @staticmethod
+    def sniff(buffer: any, sample_size: int = 65536, bom: bool = True) -> str:
+        """バイト列の先頭からエンコーディングを推定する。BOM、ASCII、UTF-8の順に判定し、いずれでもない場合はcp932とする。
+        ASCIIだけのバイト列はutf-8と判定されるが、cp932でも同じ文字になるためどちらでも正しく変換できる。
+        """
+        with memoryview(buffer) as view:
+            sample = view[:sample_size].tobytes()
+        if bom:
+            for one, encoding in StringDecoder.boms:
+                if sample.startswith(one):
+                    return encoding
+        if sample.isascii():
+            return "utf-8"
+        try:
+            codecs.getincrementaldecoder("utf-8")("strict").decode(sample, False)
+            return "utf-8"
+        except UnicodeDecodeError:
+            return "cp932"
+
+    candidate_encodings = ("utf-8", "cp932")
+
+    sample_size = 65536
+
+    boms = (
+        (codecs.BOM_UTF8, "utf-8-sig"),
+        (codecs.BOM_UTF16_LE, "utf-16"),
+        (codecs.BOM_UTF16_BE, "utf-16"),
+    )
+
+    non_ascii_pattern = re.compile(b"[\\x80-\\xff]")
@@ -0,0 +1,37 @@
+import scent_python as scent
+import codecs
+
+
+class StringEncoder(scent.Object):
+    """文字列を順番に受け取り、バイト列に変換するクラス。
+    変換結果はあらかじめ確保したbytearrayやmemoryviewに書き込むことができる。
+    """
+
+    def __init__(self, encoding: str = "utf-8"):
+        self._encoding = encoding
+        self._encoder = codecs.getincrementalencoder(encoding)("replace")
+
+    @property
+    def encoding(self) -> str:
+        return self._encoding
+
+    def encode(self, value: any, final: bool = False) -> bytes:
+        """文字列をバイト列に変換する。
+        """
+        return self._encoder.encode(str(value), final)
+
+    def encode_into(self, value: any, buffer: any, offset: int = 0, final: bool = False) -> int:
+        """文字列を変換してbufferのoffsetの位置から書き込み、書き込んだバイト数を返す。
+        bufferの残りの領域が足りない場合はBufferErrorが発生する。
+        """
+        encoded = self._encoder.encode(str(value), final)
+        with memoryview(buffer) as view:
+            if offset + encoded.__len__() > view.nbytes:
+                raise BufferError("Buffer is too small to write the encoded value.")
+            view[offset:offset + encoded.__len__()] = encoded
+        return encoded.__len__()
+
+    def reset(self):
+        """変換の状態を初期化する。
+        """
+        self._encoder.reset()
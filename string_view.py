@@ -0,0 +1,82 @@
+import scent_python as scent
+import sys
+
+
+class StringView(scent.Object):
+    """文字列の一部分を複製せずに参照するクラス。
+    参照元の文字列は変更されないため、String側の値が変更されても作成時の内容を参照し続ける。
+    """
+
+    def __init__(self, source: str, start: int = 0, end: int = sys.maxsize):
+        self._source = source
+        self._start, self._end = StringView._clamp(source.__len__(), start, end)
+
+    @staticmethod
+    def _clamp(length: int, start: int, end: int) -> tuple:
+        if start < 0:
+            start = max(length + start, 0)
+        if end < 0:
+            end = length + end
+        start = min(start, length)
+        return (start, max(min(end, length), start))
+
+    @property
+    def source(self) -> str:
+        return self._source
+
+    @property
+    def start(self) -> int:
+        return self._start
+
+    @property
+    def end(self) -> int:
+        return self._end
+
+    @property
+    def value(self) -> str:
+        return self._source[self._start:self._end]
+
+    def __repr__(self) -> str:
+        return repr(self.value)
+
+    def __str__(self) -> str:
+        return self.value
+
+    def __eq__(self, other: any) -> bool:
+        if isinstance(other, StringView):
+            return self.length() == other.length() and self.value == other.value
+        return self.value == str(other)
+
+    def __len__(self) -> int:
+        return self._end - self._start
+
+    def __iter__(self):
+        return map(self._source.__getitem__, range(self._start, self._end))
+
+    def __getitem__(self, index: int | slice) -> "str | StringView":
+        if isinstance(index, slice):
+            start, end, step = index.indices(self.length())
+            if step != 1:
+                return self.value[index]
+            return StringView(self._source, self._start + start, self._start + max(end, start))
+        if index < 0:
+            index += self.length()
+        if index < 0 or index >= self.length():
+            raise IndexError("StringView index out of range.")
+        return self._source[self._start + index]
+
+    def length(self) -> int:
+        """文字数を取得する。
+        """
+        return self._end - self._start
+
+    def window(self, start: int = 0, end: int = sys.maxsize) -> "StringView":
+        """この範囲内の一部分を参照するインスタンスを作成する。
+        """
+        start, end = StringView._clamp(self.length(), start, end)
+        return StringView(self._source, self._start + start, self._start + end)
+
+    def to_string(self) -> "scent.String":
+        """この範囲の文字列からStringを作成する。
+        """
+        return scent.String(self.value)
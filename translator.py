@@ -0,0 +1,84 @@
+import scent_python as scent
+import re
+
+
+class Translator(scent.Object):
+    """変換表から文字列を変換するクラス。
+    1文字のキーはstr.translateの変換テーブル、2文字以上のキーは最長一致の正規表現として一度だけ構築される。
+    変換対象の文字を含まない文字列は正規表現の検索だけで変換を省略する。
+    """
+
+    def __init__(self, table: dict):
+        self._table = dict(table)
+        single_table = {}
+        multiple_table = {}
+        for key, value in self._table.items():
+            if len(key) == 1:
+                if len(value) == 1:
+                    value = ord(value)
+                single_table[ord(key)] = value
+            elif len(key) > 1:
+                multiple_table[key] = value
+        self._single_table = single_table
+        self._multiple_table = multiple_table
+        keys = sorted(multiple_table.keys(), key=len, reverse=True)
+        self._prefixes = frozenset(key[:index] for key in keys for index in range(1, len(key)))
+        self._multiple_pattern = None
+        if len(keys) > 0:
+            self._multiple_pattern = re.compile("(" + "|".join(map(re.escape, keys)) + ")")
+        characters = set(map(chr, single_table.keys()))
+        characters.update(key[0] for key in keys)
+        self._pattern = None
+        if len(characters) > 0:
+            self._pattern = re.compile("[" + "".join(map(re.escape, sorted(characters))) + "]")
+
+    @property
+    def table(self) -> dict:
+        return self._table
+
+    def translate(self, value: str) -> str:
+        """変換表に従って文字列を変換する。
+        """
+        if self._pattern is None or self._pattern.search(value) is None:
+            return value
+        if self._multiple_pattern is None:
+            return value.translate(self._single_table)
+        parts = self._multiple_pattern.split(value)
+        if len(parts) == 1:
+            return value.translate(self._single_table)
+        single_table = self._single_table
+        multiple_table = self._multiple_table
+        for index in range(len(parts)):
+            if index % 2 == 0:
+                parts[index] = parts[index].translate(single_table)
+            else:
+                parts[index] = multiple_table[parts[index]]
+        return "".join(parts)
+
+    def incomplete_suffix_length(self, value: str) -> int:
+        """末尾のうち、後に続く文字によって2文字以上のキーに一致する可能性がある部分の文字数を取得する。
+        """
+        length = min(len(value), max(map(len, self._prefixes), default=0))
+        while length > 0:
+            if value[-length:] in self._prefixes:
+                return length
+            length -= 1
+        return 0
+
+    def is_composable(self) -> bool:
+        """ほかの変換器の後に合成できる場合はTrueを返す。2文字以上のキーを持つ変換器は合成できない。
+        """
+        return len(self._multiple_table) == 0
+
+    def compose(self, following: "Translator") -> "Translator":
+        """この変換器の後にfollowingを適用した結果と等しい変換器を作成する。
+        """
+        if following.is_composable() == False:
+            raise ValueError("Translator with multiple character keys cannot follow another translator.")
+        table = {}
+        for key, value in self._table.items():
+            table[key] = following.translate(value)
+        for key, value in following.table.items():
+            if key not in table:
+                table[key] = value
+        return Translator(table)